@@ -70,7 +70,9 @@ class NumericTableEvaluator:
     def _build_context(self, clause: NormClause) -> NumericContext:
         notes: List[str] = []
         text = clause.text or clause.normalized_text or ""
-        amount_multiplier = utils.infer_currency_multiplier(text)
+        # One memoized scan supplies both the currency multiplier and the
+        # percentage values for this clause.
+        _, percent_values, amount_multiplier = utils.scan_numeric(text)
         amounts: List[float] = []
         amount_spans: List[Tuple[int, int]] = []
         for match in re.finditer(r"\\d+[\\d,\\.]*", text):
@@ -81,7 +83,7 @@ class NumericTableEvaluator:
                 continue
             amounts.append(utils.expand_numeric_value(value, amount_multiplier))
             amount_spans.append((match.start(), match.end()))
-        percentages = utils.extract_percentage_tokens(text)
+        percentages = list(percent_values)
         percentage_spans: List[Tuple[int, int]] = []
         for match in re.finditer(r"\\d+(?:\\.\\d+)?%", text):
             percentage_spans.append(match.span())
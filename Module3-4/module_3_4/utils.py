@@ -3,20 +3,37 @@
 """Utility helpers for the Module 3-4 execution engine."""
 
 import re
+from collections import deque
+from functools import lru_cache
+from itertools import islice, tee
 from typing import Iterator, List, Sequence, Tuple
 
 _NUMERIC_TOKEN = re.compile(r"(?<![\w.])(\d+[\d,\.]*)(?![\w.])")
 _PERCENT_TOKEN = re.compile(r"(\d+(?:\.\d+)?)\s*%")
-_CURRENCY_SUFFIX = re.compile(r"(\uB9CC\uC6D0|\uC5B5\uC6D0|KRW|\uC6D0)")
+# Zero-width probe evaluated only where a number can start; each lookahead mirrors
+# one of the patterns above so a single walk reports both token kinds.
+_NUMERIC_SCAN = re.compile(
+    r"(?=\d)"
+    r"(?:(?=(?P<pct>(?P<pct_value>\d+(?:\.\d+)?)\s*%)))?"
+    r"(?:(?=(?<![\w.])(?P<num>\d+[\d,\.]*)(?![\w.])))?"
+)
+_SUFFIX_MULT = {"\uB9CC\uC6D0": 10_000.0, "\uC5B5\uC6D0": 100_000_000.0, "KRW": 1.0, "\uC6D0": 1.0}
+_SUFFIX_KEYS = tuple(_SUFFIX_MULT)
+_SENT_SPLIT = re.compile(r"(?<=[.!?])\s+")
 
 def safe_lower(text: str) -> str:
     return text.lower() if text else ""
 
 def sentence_chunks(text: str) -> List[str]:
+    return list(isentence_chunks(text))
+
+def isentence_chunks(text: str) -> Iterator[str]:
     if not text:
-        return []
-    splits = re.split(r"(?<=[.!?])\s+", text)
-    return [chunk.strip() for chunk in splits if chunk.strip()]
+        return
+    for chunk in _SENT_SPLIT.split(text):
+        chunk = chunk.strip()
+        if chunk:
+            yield chunk
 
 def gather_snippet(text: str, spans: Sequence[Tuple[int, int]], window: int = 80) -> str:
     if not spans:
@@ -29,45 +46,70 @@ def gather_snippet(text: str, spans: Sequence[Tuple[int, int]], window: int = 80
 def clamp(value: float, minimum: float = 0.0, maximum: float = 1.0) -> float:
     return max(minimum, min(maximum, value))
 
+@lru_cache(maxsize=256)
+def scan_numeric(text: str) -> Tuple[Tuple[float, ...], Tuple[float, ...], float]:
+    """Returns (numbers, percentages, currency multiplier) from one pass over text.
+
+    Matches are identical to running ``_NUMERIC_TOKEN``/``_PERCENT_TOKEN``
+    ``finditer`` separately.
+    """
+    numbers: List[float] = []
+    percentages: List[float] = []
+    num_resume = pct_resume = 0
+    for match in _NUMERIC_SCAN.finditer(text or ""):
+        position = match.start()
+        if position >= pct_resume and match.group("pct") is not None:
+            pct_resume = match.end("pct")
+            try:
+                percentages.append(float(match.group("pct_value")) / 100.0)
+            except ValueError:
+                pass
+        if position >= num_resume and match.group("num") is not None:
+            num_resume = match.end("num")
+            try:
+                numbers.append(float(match.group("num").replace(",", "")))
+            except ValueError:
+                pass
+    return tuple(numbers), tuple(percentages), infer_currency_multiplier(text)
+
 def extract_numeric_tokens(text: str) -> List[float]:
-    values: List[float] = []
-    for match in _NUMERIC_TOKEN.finditer(text or ""):
-        token = match.group(1)
-        cleaned = token.replace(",", "")
-        try:
-            values.append(float(cleaned))
-        except ValueError:
-            continue
-    return values
+    return list(scan_numeric(text or "")[0])
 
 def extract_percentage_tokens(text: str) -> List[float]:
-    values: List[float] = []
-    for match in _PERCENT_TOKEN.finditer(text or ""):
-        try:
-            values.append(float(match.group(1)) / 100.0)
-        except ValueError:
-            continue
-    return values
+    return list(scan_numeric(text or "")[1])
 
 def infer_currency_multiplier(text: str) -> float:
     """Maps Korean suffixes (\uB9CC\uC6D0 = 10k) to numeric multipliers."""
     if not text:
         return 1.0
-    suffix_match = _CURRENCY_SUFFIX.search(text)
-    if not suffix_match:
-        return 1.0
-    suffix = suffix_match.group(1)
-    if suffix == "\uB9CC\uC6D0":
-        return 10_000.0
-    if suffix == "\uC5B5\uC6D0":
-        return 100_000_000.0
-    return 1.0
+    # The earliest suffix wins; suffixes start with distinct characters, so at
+    # most one can occur at any given offset.
+    best_pos = len(text)
+    best_suffix = None
+    for suffix in _SUFFIX_KEYS:
+        pos = text.find(suffix, 0, best_pos)
+        if pos != -1:
+            best_pos = pos
+            best_suffix = suffix
+    return _SUFFIX_MULT[best_suffix] if best_suffix is not None else 1.0
 
 def expand_numeric_value(raw: float, suffix_multiplier: float) -> float:
     return raw * suffix_multiplier
 
-def rolling_window(tokens: Sequence[str], size: int) -> Iterator[Sequence[str]]:
+_TEE_WINDOW_LIMIT = 20
+
+def rolling_window(tokens: Sequence[str], size: int) -> Iterator[Tuple[str, ...]]:
     if size <= 0:
-        return iter(())
-    for index in range(len(tokens) - size + 1):
-        yield tokens[index : index + size]
+        return
+    if size <= _TEE_WINDOW_LIMIT:
+        # Small windows: let zip() assemble each tuple from staggered iterators.
+        iterators = tee(tokens, size)
+        for offset, iterator in enumerate(iterators):
+            next(islice(iterator, offset, offset), None)
+        yield from zip(*iterators)
+        return
+    iterator = iter(tokens)
+    window = deque(islice(iterator, size - 1), maxlen=size)
+    for token in iterator:
+        window.append(token)
+        yield tuple(window)
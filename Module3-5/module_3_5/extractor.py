@@ -4,7 +4,7 @@ import json
 import re
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence, Tuple
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from .schemas import Evidence, Hit, NormClause
 
@@ -12,7 +12,7 @@ from .schemas import Evidence, Hit, NormClause
 _UTF8_SIG = "utf-8-sig"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Sentence:
     start: int
     end: int
@@ -25,6 +25,10 @@ class Sentence:
 DEFAULT_MIN_LENGTH = 120
 DEFAULT_MAX_LENGTH = 300
 CONTEXT_SENTENCE_PADDING = 1
+PARALLEL_MIN_HITS = 1000
+# A sentence ends at . ! or ? plus trailing closers; the same-line whitespace after
+# it is skipped. A run of two or more line breaks separates paragraphs.
+_SENTENCE_BREAK = re.compile(r"""(?P<term>[.!?]["\\')\]}]*)[^\S\n]*|\n[\r\n]*""")
 SENSITIVE_PATTERNS = [
     re.compile(r"\b(?:\d{2,}-){2,}\d{2,}\b"),
     re.compile(r"\b\d{4,}\b"),
@@ -32,6 +36,13 @@ SENSITIVE_PATTERNS = [
     re.compile(r"\b\d{2,3}-\d{2}-\d{6}\b"),
     re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}"),
 ]
+# All of SENSITIVE_PATTERNS as one alternation, email first. Its leftmost matches
+# cover the same characters as the separate passes as long as every match is
+# ASCII; a number match holding a non-ASCII digit can hide an email that starts
+# inside it, so such snippets fall back to the separate passes.
+_SENSITIVE_ANY = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for pattern in (SENSITIVE_PATTERNS[-1], *SENSITIVE_PATTERNS[:-1]))
+)
 
 
 class ClauseNotFoundError(KeyError):
@@ -49,8 +60,7 @@ def load_clauses(path: Path) -> Dict[str, NormClause]:
             payload = list(data.values())
     else:
         payload = data
-    clauses = [NormClause.from_dict(item) for item in payload]
-    return {clause.id: clause for clause in clauses}
+    return {clause.id: clause for clause in map(NormClause.from_dict, payload)}
 
 
 def load_hits(path: Path) -> List[Hit]:
@@ -92,44 +102,114 @@ def extract_evidence(
         if clause is None:
             raise ClauseNotFoundError(f"Unknown clause_id '{hit.clause_id}' in hit {hit.rule_id}")
         sentences = _resolve_sentences(clause)
-        merged_spans = _merge_spans(hit.spans, len(clause.text))
-        snippet_info = _build_snippet_window(
-            clause_text=clause.text,
-            sentences=sentences,
-            highlight_spans=merged_spans,
+        results.append(
+            _build_evidence(hit, clause, sentences, target_min, target_max, redact_sensitive)
+        )
+    return results
+
+
+def extract_evidence_parallel(
+    clauses: Dict[str, NormClause],
+    hits: Sequence[Hit],
+    *,
+    target_min: int = DEFAULT_MIN_LENGTH,
+    target_max: int = DEFAULT_MAX_LENGTH,
+    redact_sensitive: bool = False,
+    n_workers: Optional[int] = None,
+    min_hits: int = PARALLEL_MIN_HITS,
+) -> List[Evidence]:
+    """Process-pool variant of :func:`extract_evidence` with identical output.
+
+    Hits are grouped by ``clause_id`` so each worker resolves a clause's
+    sentences once for all of its hits.  Inputs smaller than ``min_hits``
+    run serially, where pool start-up would dominate.
+    """
+    if len(hits) < min_hits:
+        return extract_evidence(
+            clauses,
+            hits,
             target_min=target_min,
             target_max=target_max,
+            redact_sensitive=redact_sensitive,
         )
-        snippet = snippet_info.snippet
-        highlights_rel = _relativize_highlights(snippet_info.start, merged_spans, len(snippet))
-        overflow = snippet_info.overflow
-        context_padding = snippet_info.context_padding
-        notes = list(hit.notes)
-        if redact_sensitive:
-            snippet, redacted = _redact_snippet(snippet)
-            if redacted and "redacted_sensitive" not in notes:
-                notes.append("redacted_sensitive")
-        evidence = Evidence(
-            rule_id=hit.rule_id,
-            clause_id=hit.clause_id,
-            match_type=hit.match_type,
-            snippet=snippet,
-            snippet_char_start_abs=snippet_info.start,
-            snippet_char_end_abs=snippet_info.end,
-            highlights_rel=highlights_rel,
-            sentence_span=(snippet_info.sent_start_idx, snippet_info.sent_end_idx),
-            context_window_sentences=context_padding,
-            overflow=overflow,
-            strength=hit.strength,
-            notes=notes,
-            table_ctx=hit.table_ctx,
-            numeric_ctx=hit.numeric_ctx,
-        )
-        results.append(evidence)
-    return results
+    if target_min > target_max:
+        target_min, target_max = target_max, target_min
+    groups: Dict[str, List[Tuple[int, Hit]]] = {}
+    for position, hit in enumerate(hits):
+        if hit.clause_id not in clauses:
+            raise ClauseNotFoundError(f"Unknown clause_id '{hit.clause_id}' in hit {hit.rule_id}")
+        groups.setdefault(hit.clause_id, []).append((position, hit))
+    tasks = [
+        (clauses[clause_id], group, target_min, target_max, redact_sensitive)
+        for clause_id, group in groups.items()
+    ]
+    # Imported here: concurrent.futures.process pulls in multiprocessing, which
+    # otherwise dominates CLI start-up for the serial path.
+    from concurrent.futures import ProcessPoolExecutor
+
+    results: List[Optional[Evidence]] = [None] * len(hits)
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        for group_results in executor.map(_extract_clause_group, tasks):
+            for position, evidence in group_results:
+                results[position] = evidence
+    return results  # type: ignore[return-value]
+
+
+def _extract_clause_group(
+    task: Tuple[NormClause, List[Tuple[int, Hit]], int, int, bool],
+) -> List[Tuple[int, Evidence]]:
+    clause, group, target_min, target_max, redact_sensitive = task
+    sentences = _resolve_sentences(clause)
+    return [
+        (position, _build_evidence(hit, clause, sentences, target_min, target_max, redact_sensitive))
+        for position, hit in group
+    ]
+
+
+def _build_evidence(
+    hit: Hit,
+    clause: NormClause,
+    sentences: Sequence[Sentence],
+    target_min: int,
+    target_max: int,
+    redact_sensitive: bool,
+) -> Evidence:
+    merged_spans = _merge_spans(hit.spans, len(clause.text))
+    snippet_info = _build_snippet_window(
+        clause_text=clause.text,
+        sentences=sentences,
+        highlight_spans=merged_spans,
+        target_min=target_min,
+        target_max=target_max,
+    )
+    snippet = snippet_info.snippet
+    highlights_rel = _relativize_highlights(snippet_info.start, merged_spans, len(snippet))
+    overflow = snippet_info.overflow
+    context_padding = snippet_info.context_padding
+    notes = list(hit.notes)
+    if redact_sensitive:
+        snippet, redacted = _redact_snippet(snippet)
+        if redacted and "redacted_sensitive" not in notes:
+            notes.append("redacted_sensitive")
+    return Evidence(
+        rule_id=hit.rule_id,
+        clause_id=hit.clause_id,
+        match_type=hit.match_type,
+        snippet=snippet,
+        snippet_char_start_abs=snippet_info.start,
+        snippet_char_end_abs=snippet_info.end,
+        highlights_rel=highlights_rel,
+        sentence_span=(snippet_info.sent_start_idx, snippet_info.sent_end_idx),
+        context_window_sentences=context_padding,
+        overflow=overflow,
+        strength=hit.strength,
+        notes=notes,
+        table_ctx=hit.table_ctx,
+        numeric_ctx=hit.numeric_ctx,
+    )
 
 
-@dataclass
+@dataclass(slots=True)
 class SnippetWindow:
     start: int
     end: int
@@ -231,15 +311,22 @@ def _sentences_covering_highlights(
 
 def _merge_spans(spans: Sequence[Tuple[int, int]], length: int) -> List[Tuple[int, int]]:
     cleaned = []
+    in_order = True
+    last_start = -1
     for start, end in spans:
         start = max(0, min(start, length))
         end = max(start, min(end, length))
         if start == end:
             continue
+        if start < last_start:
+            in_order = False
+        last_start = start
         cleaned.append((start, end))
     if not cleaned:
         return []
-    cleaned.sort(key=lambda pair: pair[0])
+    # Module 3-4 normally emits spans in increasing order; only sort when it did not.
+    if not in_order:
+        cleaned.sort(key=lambda pair: pair[0])
     merged: List[Tuple[int, int]] = []
     cur_start, cur_end = cleaned[0]
     for start, end in cleaned[1:]:
@@ -267,54 +354,31 @@ def _resolve_sentences(clause: NormClause) -> List[Sentence]:
 
 
 def _heuristic_sentence_boundaries(text: str) -> List[Sentence]:
-    boundaries: List[Sentence] = []
+    boundaries: List[Tuple[int, int]] = []
     start = 0
-    idx = 0
     length = len(text)
-    while idx < length:
-        char = text[idx]
-        if char in ".!?":
-            lookahead = idx + 1
-            while lookahead < length and text[lookahead] in '\"\\\')]}':
-                lookahead += 1
-            end = lookahead
-            boundaries.append(Sentence(start, end))
-            idx = end
-            while idx < length and text[idx].isspace() and text[idx] != '\n':
-                idx += 1
-            start = idx
-        elif char == '\n':
-            newline_block_end = idx
-            while newline_block_end < length and text[newline_block_end] in '\r\n':
-                newline_block_end += 1
-            if newline_block_end - idx >= 2:
-                end = idx
-                if end > start:
-                    boundaries.append(Sentence(start, end))
-                start = newline_block_end
-            idx = newline_block_end
+    for match in _SENTENCE_BREAK.finditer(text):
+        if match.group("term") is not None:
+            boundaries.append((start, match.end("term")))
+            start = match.end()
         else:
-            idx += 1
+            block_start, block_end = match.span()
+            if block_end - block_start >= 2:
+                if block_start > start:
+                    boundaries.append((start, block_start))
+                start = block_end
     if start < length:
-        boundaries.append(Sentence(start, length))
+        boundaries.append((start, length))
 
     cleaned: List[Sentence] = []
-    for sentence in boundaries:
-        seg = text[sentence.start:sentence.end]
-        if not seg.strip():
+    for seg_start, seg_end in boundaries:
+        seg = text[seg_start:seg_end]
+        stripped = seg.lstrip()
+        if not stripped:
             continue
-        leading = 0
-        while sentence.start + leading < sentence.end and text[sentence.start + leading].isspace():
-            leading += 1
-        trailing = 0
-        while sentence.end - trailing - 1 >= sentence.start and text[sentence.end - trailing - 1].isspace():
-            trailing += 1
-        cleaned.append(
-            Sentence(
-                sentence.start + leading,
-                max(sentence.start + leading, sentence.end - trailing),
-            )
-        )
+        leading = len(seg) - len(stripped)
+        trailing = len(stripped) - len(stripped.rstrip())
+        cleaned.append(Sentence(seg_start + leading, seg_end - trailing))
     if not cleaned:
         cleaned.append(Sentence(0, length))
     return cleaned
@@ -339,29 +403,44 @@ def _relativize_highlights(
 def _redact_snippet(snippet: str) -> Tuple[str, bool]:
     if not snippet:
         return snippet, False
-    chars = list(snippet)
-    mask = [False] * len(chars)
-    for pattern in SENSITIVE_PATTERNS:
-        for match in pattern.finditer(snippet):
-            for idx in range(match.start(), match.end()):
-                mask[idx] = True
-    if not any(mask):
+    spans = sorted(_sensitive_spans(snippet))
+    if not spans:
         return snippet, False
-    idx = 0
-    while idx < len(chars):
-        if mask[idx]:
-            block_start = idx
-            while idx < len(chars) and mask[idx]:
-                chars[idx] = "*"
-                idx += 1
-            block_len = idx - block_start
-            if block_len < 4:
-                for offset in range(block_len, 4):
-                    insert_pos = min(block_start + offset, len(chars) - 1)
-                    chars[insert_pos] = "*"
+    blocks: List[Tuple[int, int]] = []
+    cur_start, cur_end = spans[0]
+    for start, end in spans[1:]:
+        if start <= cur_end:
+            cur_end = max(cur_end, end)
         else:
-            idx += 1
-    return "".join(chars), True
+            blocks.append((cur_start, cur_end))
+            cur_start, cur_end = start, end
+    blocks.append((cur_start, cur_end))
+
+    # Blocks shorter than four characters are widened to four (clamped to the
+    # snippet end) so the mask does not reveal the length of short tokens.
+    length = len(snippet)
+    parts: List[str] = []
+    cursor = 0
+    for start, end in blocks:
+        end = max(end, min(start + 4, length))
+        start = max(start, cursor)
+        if end <= start:
+            continue
+        parts.append(snippet[cursor:start])
+        parts.append("*" * (end - start))
+        cursor = end
+    parts.append(snippet[cursor:])
+    return "".join(parts), True
+
+
+def _sensitive_spans(snippet: str) -> List[Tuple[int, int]]:
+    """Return character spans covering every match of ``SENSITIVE_PATTERNS``."""
+    spans: List[Tuple[int, int]] = []
+    for match in _SENSITIVE_ANY.finditer(snippet):
+        if not match.group().isascii():
+            return [found.span() for pattern in SENSITIVE_PATTERNS for found in pattern.finditer(snippet)]
+        spans.append(match.span())
+    return spans
 
 
 def _read_json(path: Path):
@@ -373,7 +452,9 @@ __all__ = [
     "ClauseNotFoundError",
     "DEFAULT_MAX_LENGTH",
     "DEFAULT_MIN_LENGTH",
+    "PARALLEL_MIN_HITS",
     "extract_evidence",
+    "extract_evidence_parallel",
     "load_clauses",
     "load_hits",
 ]
@@ -4,6 +4,22 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 
+def _parse_spans(raw_spans: Iterable[Any]) -> List[Tuple[int, int]]:
+    """Parse ``[start, end]`` pairs or ``{"start", "end"}`` objects into int tuples."""
+    _int = int
+    _isinstance = isinstance
+    spans: List[Tuple[int, int]] = []
+    append = spans.append
+    for span in raw_spans:
+        if _isinstance(span, dict):
+            start = _int(span.get("start", 0))
+            append((start, _int(span.get("end", start))))
+        else:
+            start, end = span
+            append((_int(start), _int(end)))
+    return spans
+
+
 @dataclass
 class NormClause:
     """Normalized clause payload emitted from Module 3-2."""
@@ -22,17 +38,7 @@ class NormClause:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "NormClause":
         sent_bounds = data.get("sent_boundaries") or data.get("sentence_spans")
-        if sent_bounds is not None:
-            parsed_bounds: List[Tuple[int, int]] = []
-            for pair in sent_bounds:
-                if isinstance(pair, dict):
-                    start = int(pair.get("start", 0))
-                    end = int(pair.get("end", start))
-                else:
-                    start, end = pair
-                parsed_bounds.append((start, end))
-        else:
-            parsed_bounds = None
+        parsed_bounds = _parse_spans(sent_bounds) if sent_bounds is not None else None
         return cls(
             id=str(data["id"]),
             index_path=data.get("index_path"),
@@ -104,7 +110,7 @@ class NumericContext:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Hit:
     rule_id: str
     clause_id: str
@@ -117,20 +123,11 @@ class Hit:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Hit":
-        raw_spans = data.get("spans") or []
-        spans: List[Tuple[int, int]] = []
-        for span in raw_spans:
-            if isinstance(span, dict):
-                start = int(span.get("start", 0))
-                end = int(span.get("end", start))
-            else:
-                start, end = span
-            spans.append((start, end))
         return cls(
             rule_id=str(data.get("rule_id")),
             clause_id=str(data.get("clause_id")),
             match_type=str(data.get("match_type", "")),
-            spans=spans,
+            spans=_parse_spans(data.get("spans") or ()),
             strength=data.get("strength"),
             notes=list(data.get("notes", []) or []),
             table_ctx=TableContext.from_payload(data.get("table_ctx")),
@@ -138,7 +135,7 @@ class Hit:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Evidence:
     rule_id: str
     clause_id: str
@@ -1,6 +1,11 @@
 from pathlib import Path
 
-from module_3_5.extractor import extract_evidence, load_clauses, load_hits
+from module_3_5.extractor import (
+    extract_evidence,
+    extract_evidence_parallel,
+    load_clauses,
+    load_hits,
+)
 
 
 SAMPLES_DIR = Path(__file__).resolve().parent.parent / "samples"
@@ -48,4 +53,21 @@ def test_redaction_masks_sensitive_tokens():
     assert "110-222-3333333" not in first["snippet"]
     assert "***" in first["snippet"] or "****" in first["snippet"]
     assert first["highlights_rel"] == [[39, 69]]
-    assert "redacted_sensitive" in first["notes"]
+    assert "redacted_sensitive" in first["notes"]
+
+
+def test_parallel_extraction_matches_serial_order():
+    clauses, hits = _load_fixture()
+    hits = list(reversed(hits)) * 3
+    serial = extract_evidence(clauses, hits, target_min=40, target_max=180, redact_sensitive=True)
+    parallel = extract_evidence_parallel(
+        clauses,
+        hits,
+        target_min=40,
+        target_max=180,
+        redact_sensitive=True,
+        n_workers=2,
+        min_hits=0,
+    )
+
+    assert [ev.to_dict() for ev in parallel] == [ev.to_dict() for ev in serial]
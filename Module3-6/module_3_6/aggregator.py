@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable, List, Sequence, Tuple
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
 
-from .calibrator import CalibrationClause, ThresholdCalibrator
-from .risk_scorer import ClauseComputation
+from .calibrator import ThresholdCalibrator
+from .risk_scorer import ClauseComputations
 from .schemas import ClauseScore, Policy
 
 
@@ -12,45 +13,72 @@ class Aggregator:
         self.policy = policy
         self._calibrator = ThresholdCalibrator(policy.calibration)
 
-    def aggregate(self, computations: Sequence[ClauseComputation]) -> Tuple[List[ClauseScore], Dict[str, object]]:
-        computations = sorted(computations, key=lambda item: item.clause_id)
+    def aggregate(self, computations: ClauseComputations) -> Tuple[List[ClauseScore], Dict[str, object]]:
+        computations = computations.sorted_by_clause_id()
         thresholds = dict(self.policy.thresholds)
-        calibration_input = [
-            CalibrationClause(
-                clause_id=comp.clause_id,
-                confidence=comp.confidence,
-                metadata=comp.metadata,
-            )
-            for comp in computations
-        ]
-        warn_threshold, demotions = self._calibrator.calibrate(calibration_input, thresholds)
+        confidences = computations.confidences
+        clause_ids = computations.clause_ids
+        metadatas = computations.metadatas
+        warn_threshold, demotions = self._calibrator.calibrate(
+            confidences, clause_ids, metadatas, thresholds
+        )
         thresholds["WARN"] = warn_threshold
 
         high_threshold = thresholds.get("HIGH", 0.99)
         ambig_gap = thresholds.get("ambig_gap", 0.08)
 
-        results: List[ClauseScore] = []
-        counters = {"HIGH": 0, "WARN": 0, "OK": 0, "AMBIG": 0}
+        effective_gap = max(ambig_gap, 0.0)
+        warn_cutoff = warn_threshold + effective_gap
+        # Single pass over the confidence column. Demotions only ever contain
+        # clauses at or above HIGH, so membership is checked on that branch alone.
+        risk_flags: List[str] = []
+        for confidence, clause_id in zip(confidences, clause_ids):
+            if confidence >= high_threshold:
+                risk_flags.append("WARN" if clause_id in demotions else "HIGH")
+            elif confidence >= warn_cutoff:
+                risk_flags.append("WARN")
+            elif confidence >= warn_threshold:
+                risk_flags.append("AMBIG")
+            else:
+                risk_flags.append("OK")
+        counters = Counter(risk_flags)
+
+        # Reason strings depend only on the thresholds, so format them once.
+        # Each clause's reasons are built with a single concatenation onto one
+        # of these shared tails.
+        high_msg = f"confidence >= HIGH ({high_threshold:.2f})"
+        high_tail = [high_msg]
+        demoted_tail = ["demoted_high_without_critical", high_msg, "demoted_to_WARN via calibration"]
+        warn_tail = [f"confidence >= WARN ({warn_threshold:.2f}) with gap {ambig_gap:.2f}"]
+        ambig_tail = [f"within ambig window [{warn_threshold:.2f}, {warn_cutoff:.2f})"]
+        low_tail = [f"confidence < WARN ({warn_threshold:.2f})"]
+        base_reasons = computations.reasons
 
-        for comp in computations:
-            risk_flag, reasons = self._classify(
-                comp,
-                high_threshold,
-                warn_threshold,
-                ambig_gap,
-                demotions,
-            )
-            counters[risk_flag] += 1
+        results: List[ClauseScore] = []
+        for idx, clause_id in enumerate(clause_ids):
+            confidence = confidences[idx]
+            risk_flag = risk_flags[idx]
+            if risk_flag == "OK":
+                tail = low_tail
+            elif risk_flag == "HIGH":
+                tail = high_tail
+            elif risk_flag == "AMBIG":
+                tail = ambig_tail
+            elif confidence >= high_threshold:
+                tail = demoted_tail
+            else:
+                tail = warn_tail
+            reasons = base_reasons[idx] + tail
             results.append(
                 ClauseScore(
-                    clause_id=comp.clause_id,
-                    confidence=round(comp.confidence, 6),
+                    clause_id=clause_id,
+                    confidence=round(confidence, 6),
                     risk_flag=risk_flag,
                     reasons=reasons,
-                    adopted_rules=comp.adopted_rules,
-                    suppressed_rules=comp.suppressed_rules,
-                    per_hit_scores=comp.per_hit_scores,
-                    metadata=comp.metadata,
+                    adopted_rules=computations.adopted_rules[idx],
+                    suppressed_rules=computations.suppressed_rules[idx],
+                    per_hit_scores=computations.per_hit_scores[idx],
+                    metadata=metadatas[idx],
                 )
             )
 
@@ -59,10 +87,14 @@ class Aggregator:
         ok = counters["OK"]
         ambig = counters["AMBIG"]
         denom = warn + high + ok
-        warn_rate = warn / denom if denom else 0.0
-        high_rate = high / denom if denom else 0.0
-        ok_rate = ok / denom if denom else 0.0
-        ambig_rate = ambig / (warn + high + ok + ambig) if (warn + high + ok + ambig) else 0.0
+        if denom:
+            warn_rate = warn / denom
+            high_rate = high / denom
+            ok_rate = ok / denom
+        else:
+            warn_rate = high_rate = ok_rate = 0.0
+        total = denom + ambig
+        ambig_rate = ambig / total if total else 0.0
 
         summary = {
             "warn_rate": round(warn_rate, 4),
@@ -77,43 +109,5 @@ class Aggregator:
 
         return results, summary
 
-    def _classify(
-        self,
-        comp: ClauseComputation,
-        high_threshold: float,
-        warn_threshold: float,
-        ambig_gap: float,
-        demotions: Sequence[str],
-    ) -> Tuple[str, List[str]]:
-        reasons = list(comp.reasons)
-        confidence = comp.confidence
-        demoted = comp.clause_id in demotions
-
-        if confidence >= high_threshold and not demoted:
-            reasons.append(f"confidence >= HIGH ({high_threshold:.2f})")
-            return "HIGH", reasons
-
-        if confidence >= high_threshold and demoted:
-            reasons.append("demoted_high_without_critical")
-            reasons.append(f"confidence >= HIGH ({high_threshold:.2f})")
-            reasons.append("demoted_to_WARN via calibration")
-            return "WARN", reasons
-
-        warn_cutoff = warn_threshold + max(ambig_gap, 0.0)
-        if confidence >= warn_cutoff:
-            reasons.append(
-                f"confidence >= WARN ({warn_threshold:.2f}) with gap {ambig_gap:.2f}"
-            )
-            return "WARN", reasons
-
-        if confidence >= warn_threshold:
-            reasons.append(
-                f"within ambig window [{warn_threshold:.2f}, {warn_cutoff:.2f})"
-            )
-            return "AMBIG", reasons
-
-        reasons.append(f"confidence < WARN ({warn_threshold:.2f})")
-        return "OK", reasons
-
 
 __all__ = ["Aggregator"]
@@ -1,51 +1,54 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Sequence, Set
+from bisect import bisect_left
+from typing import Dict, List, Mapping, Sequence, Set
 
 from .schemas import CalibrationSettings
 
 
-@dataclass(frozen=True)
-class CalibrationClause:
-    clause_id: str
-    confidence: float
-    metadata: Dict[str, object] = field(default_factory=dict)
-
-
 class ThresholdCalibrator:
     def __init__(self, settings: CalibrationSettings) -> None:
         self.settings = settings
 
     def calibrate(
         self,
-        clauses: Sequence[CalibrationClause],
+        confidences: Sequence[float],
+        clause_ids: Sequence[str],
+        metadatas: Sequence[Mapping[str, object]],
         thresholds: Dict[str, float],
     ) -> tuple[float, Set[str]]:
-        warn_threshold = self._choose_warn_threshold(clauses, thresholds)
+        """Choose the WARN threshold and the HIGH clauses to demote.
+
+        ``confidences``, ``clause_ids`` and ``metadatas`` are parallel columns,
+        one entry per clause.
+        """
+        warn_threshold = self._choose_warn_threshold(confidences, thresholds)
         demotions: Set[str] = set()
-        if self.settings.demote_high_to_warn:
-            demotions = self._find_demotions(clauses, thresholds.get("HIGH", 0.99))
+        if not confidences or not self.settings.demote_high_to_warn:
+            return warn_threshold, demotions
+        high_threshold = thresholds.get("HIGH", 0.99)
+        # Nothing can be demoted unless some clause reaches HIGH.
+        if max(confidences) >= high_threshold:
+            demotions = self._find_demotions(confidences, clause_ids, metadatas, high_threshold)
         return warn_threshold, demotions
 
     def _choose_warn_threshold(
         self,
-        clauses: Sequence[CalibrationClause],
+        confidences: Sequence[float],
         thresholds: Dict[str, float],
     ) -> float:
         base_warn = thresholds.get("WARN", 0.10)
         min_warn = self.settings.min_warn
         max_warn = self.settings.max_warn
-        if not clauses or not self.settings.enable or min_warn >= max_warn:
+        if not confidences or not self.settings.enable or min_warn >= max_warn:
             return _clamp(base_warn, min_warn, max_warn)
 
         high_threshold = thresholds.get("HIGH", 0.99)
-        ambig_gap = thresholds.get("ambig_gap", 0.08)
+        effective_gap = max(thresholds.get("ambig_gap", 0.08), 0.0)
         base_warn = _clamp(base_warn, min_warn, max_warn)
 
         candidates: List[float] = [base_warn, min_warn, max_warn]
-        for clause in clauses:
-            confidence = clause.confidence
+        for confidence in confidences:
             if confidence >= high_threshold:
                 continue
             candidates.append(_clamp(confidence, min_warn, max_warn))
@@ -63,9 +66,11 @@ class ThresholdCalibrator:
         target = self.settings.target_warn_rate
         best_threshold = base_warn
         best_score = (float("inf"), float("inf"), float("inf"))
+        warn_rates = _sweep_warn_rates(
+            sorted(confidences), unique_candidates, high_threshold, effective_gap
+        )
 
-        for candidate in unique_candidates:
-            warn_rate = _warn_rate(clauses, candidate, high_threshold, ambig_gap)
+        for candidate, warn_rate in zip(unique_candidates, warn_rates):
             distance = abs(warn_rate - target)
             jitter = abs(candidate - base_warn)
             score = (distance, jitter, candidate)
@@ -77,42 +82,54 @@ class ThresholdCalibrator:
 
     def _find_demotions(
         self,
-        clauses: Sequence[CalibrationClause],
+        confidences: Sequence[float],
+        clause_ids: Sequence[str],
+        metadatas: Sequence[Mapping[str, object]],
         high_threshold: float,
     ) -> Set[str]:
         flag_name = self.settings.critical_flag
         demotions: Set[str] = set()
-        for clause in clauses:
-            confidence = clause.confidence
+        for confidence, clause_id, metadata in zip(confidences, clause_ids, metadatas):
             if confidence < high_threshold:
                 continue
-            flags = clause.metadata.get("flags", {}) if clause.metadata else {}
+            flags = metadata.get("flags", {}) if metadata else {}
             is_critical = bool(flags.get(flag_name))
             if not is_critical:
-                demotions.add(clause.clause_id)
+                demotions.add(clause_id)
         return demotions
 
 
-def _warn_rate(
-    clauses: Sequence[CalibrationClause],
-    warn_threshold: float,
+def _sweep_warn_rates(
+    sorted_confidences: Sequence[float],
+    warn_thresholds: Sequence[float],
     high_threshold: float,
-    ambig_gap: float,
-) -> float:
-    warn = high = ok = 0
-    warn_cutoff = warn_threshold + max(ambig_gap, 0.0)
-    for clause in clauses:
-        confidence = clause.confidence
-        if confidence >= high_threshold:
-            high += 1
-        elif confidence >= warn_cutoff:
-            warn += 1
-        else:
-            ok += 1
-    denom = warn + high + ok
+    effective_gap: float,
+) -> List[float]:
+    """Warn rate for every candidate threshold in one merge-style walk.
+
+    ``sorted_confidences`` must be ascending and ``effective_gap`` already
+    clamped to be non-negative.  Candidates are visited in cutoff
+    order while a single cursor advances through the confidences, so the
+    whole sweep costs O(N + C log C).
+
+    Values stay as Python floats (double precision) rather than being
+    narrowed to float32: candidates sit 1e-6 apart and cutoffs are compared
+    with ``<``, so single precision could flip a confidence across a cutoff
+    and change the chosen threshold.
+    """
+    denom = len(sorted_confidences)
+    rates = [0.0] * len(warn_thresholds)
     if denom == 0:
-        return 0.0
-    return warn / denom
+        return rates
+    high_idx = bisect_left(sorted_confidences, high_threshold)
+    cutoffs = [threshold + effective_gap for threshold in warn_thresholds]
+    cursor = 0
+    for position in sorted(range(len(cutoffs)), key=cutoffs.__getitem__):
+        cutoff = cutoffs[position]
+        while cursor < high_idx and sorted_confidences[cursor] < cutoff:
+            cursor += 1
+        rates[position] = (high_idx - cursor) / denom
+    return rates
 
 
 def _clamp(value: float, lower: float, upper: float) -> float:
@@ -121,4 +138,4 @@ def _clamp(value: float, lower: float, upper: float) -> float:
     return max(lower, min(value, upper))
 
 
-__all__ = ["CalibrationClause", "ThresholdCalibrator"]
+__all__ = ["ThresholdCalibrator"]
@@ -3,12 +3,13 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Sequence
+from typing import Any, Dict, Sequence, TextIO
 
 from .aggregator import Aggregator
 from .risk_scorer import score_clauses
-from .schemas import Policy, hits_from_payload, rules_from_payload
+from .schemas import ClauseScore, Policy, hits_from_payload, rules_from_payload
 
 _UTF8 = "utf-8"
 _UTF8_SIG = "utf-8-sig"
@@ -22,7 +23,18 @@ def _prepare_stdio() -> None:
 
 
 def _load_json(path: str | Path) -> Any:
-    with Path(path).open("r", encoding=_UTF8_SIG) as stream:
+    """Parse a JSON file, reusing the previous result while the file is unchanged.
+
+    The returned payload may be shared between calls and must not be mutated.
+    """
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    return _load_json_cached(resolved, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=16)
+def _load_json_cached(path: Path, mtime_ns: int, size: int) -> Any:
+    with path.open("r", encoding=_UTF8_SIG) as stream:
         return json.load(stream)
 
 
@@ -35,6 +47,54 @@ def _write_json(payload: Any, path: Path, indent: int | None) -> None:
             json.dump(payload, stream, ensure_ascii=False, separators=(",", ":"))
 
 
+def _write_scores(
+    results: Sequence[ClauseScore],
+    summary: Dict[str, Any],
+    path: Path,
+    indent: int | None,
+) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding=_UTF8) as stream:
+        _stream_scores(stream, results, summary, indent)
+
+
+def _stream_scores(
+    stream: TextIO,
+    results: Sequence[ClauseScore],
+    summary: Dict[str, Any],
+    indent: int | None,
+) -> None:
+    """Write ``{"results": [...], "summary": ...}`` one result at a time.
+
+    Produces the same text as ``json.dump`` on the assembled document while
+    holding only a single result dict in memory.
+    """
+    if indent is None:
+        encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+        stream.write('{"results":[')
+        for position, result in enumerate(results):
+            if position:
+                stream.write(",")
+            stream.write(encoder.encode(result.to_dict()))
+        stream.write('],"summary":')
+        stream.write(encoder.encode(summary))
+        stream.write("}")
+        return
+
+    encoder = json.JSONEncoder(ensure_ascii=False, indent=indent)
+    # Encoded JSON never contains a raw newline inside a string, so nesting a
+    # value one level deeper is a matter of extending every line break.
+    outer = "\n" + " " * indent
+    inner = outer + " " * indent
+    stream.write("{" + outer + '"results": [')
+    for position, result in enumerate(results):
+        stream.write(("," if position else "") + inner)
+        stream.write(encoder.encode(result.to_dict()).replace("\n", inner))
+    stream.write((outer if results else "") + "],")
+    stream.write(outer + '"summary": ' + encoder.encode(summary).replace("\n", outer))
+    stream.write("\n}")
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Aggregate risk scores from rule hits")
     parser.add_argument("--hits", required=True, help="Path to hits.json from Module3-4")
@@ -82,9 +142,7 @@ def main(argv: Sequence[str] | None = None) -> int:
     results, summary = aggregator.aggregate(computations)
 
     indent = args.indent if args.indent is not None else (2 if args.pretty else None)
-    scores_payload = [result.to_dict() for result in results]
-    document = {"results": scores_payload, "summary": summary}
-    _write_json(document, Path(args.out), indent)
+    _write_scores(results, summary, Path(args.out), indent)
 
     if args.summary_out:
         summary_payload = {"summary": summary}
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from dataclasses import dataclass
-from typing import Dict, Iterable, List, Tuple
+from dataclasses import dataclass, field
+from itertools import groupby
+from operator import attrgetter
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
 
-from .schemas import PerHitScore, Policy, Rule, Hit
+from .schemas import MATCH_TYPES, PerHitScore, Policy, Rule, Hit
 
 _VARIANT_FACTORS: Dict[str, float] = {
     "lex": 1.0,
@@ -12,46 +13,84 @@ _VARIANT_FACTORS: Dict[str, float] = {
     "num": 1.08,
     "table": 1.10,
 }
-
-
-@dataclass
-class ClauseComputation:
-    clause_id: str
-    confidence: float
-    per_hit_scores: List[PerHitScore]
-    adopted_rules: List[str]
-    suppressed_rules: List[str]
-    reasons: List[str]
-    metadata: Dict[str, object]
+# Indexed by ``Hit.match_type_idx``; the trailing 1.0 covers unknown types.
+_VARIANT_FACTORS_BY_IDX: Tuple[float, ...] = tuple(
+    _VARIANT_FACTORS[name] for name in MATCH_TYPES
+) + (1.0,)
+
+
+@dataclass(slots=True)
+class ClauseComputations:
+    """Per-clause scoring results stored column-wise.
+
+    Index ``i`` of every list describes the same clause.
+    """
+
+    clause_ids: List[str] = field(default_factory=list)
+    confidences: List[float] = field(default_factory=list)
+    per_hit_scores: List[List[PerHitScore]] = field(default_factory=list)
+    adopted_rules: List[List[str]] = field(default_factory=list)
+    suppressed_rules: List[List[str]] = field(default_factory=list)
+    reasons: List[List[str]] = field(default_factory=list)
+    metadatas: List[Dict[str, object]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.clause_ids)
+
+    def sorted_by_clause_id(self) -> "ClauseComputations":
+        order = sorted(range(len(self.clause_ids)), key=self.clause_ids.__getitem__)
+        if all(position == index for index, position in enumerate(order)):
+            return self
+        return ClauseComputations(
+            clause_ids=[self.clause_ids[i] for i in order],
+            confidences=[self.confidences[i] for i in order],
+            per_hit_scores=[self.per_hit_scores[i] for i in order],
+            adopted_rules=[self.adopted_rules[i] for i in order],
+            suppressed_rules=[self.suppressed_rules[i] for i in order],
+            reasons=[self.reasons[i] for i in order],
+            metadatas=[self.metadatas[i] for i in order],
+        )
 
 
 def score_clauses(
     hits: Iterable[Hit],
     rules: Dict[str, Rule],
     policy: Policy,
-) -> List[ClauseComputation]:
-    grouped: Dict[str, List[Hit]] = defaultdict(list)
-    for hit in hits:
-        grouped[hit.clause_id].append(hit)
-
-    computations: List[ClauseComputation] = []
-    for clause_id, clause_hits in grouped.items():
+) -> ClauseComputations:
+    # A stable sort keeps each clause's hits in input order and leaves the
+    # columns already ordered by clause id for the aggregator.
+    clause_key = attrgetter("clause_id")
+    sorted_hits = sorted(hits, key=clause_key)
+
+    penalty_items = [(name, name.lower(), penalty) for name, penalty in policy.penalties.items()]
+    penalty_keys = frozenset(key for _, key, _ in penalty_items)
+
+    # Rule lookups and scope multipliers do not depend on the hit; resolve each
+    # rule once per run.
+    resolved_rules: Dict[str, Tuple[Rule, float]] = {}
+    variant_factors = _VARIANT_FACTORS_BY_IDX
+
+    computations = ClauseComputations()
+    for clause_id, clause_hits in groupby(sorted_hits, key=clause_key):
         per_hit_scores: List[PerHitScore] = []
         adopted_rules: List[str] = []
         suppressed_rules: List[str] = []
         reasons: List[str] = []
         cumulative = 0.0
         flags: Dict[str, bool] = {}
-        priorities: List[int] = []
+        seen_rules: Set[str] = set()
+        max_priority = 0
         severities: List[str] = []
 
         for hit in clause_hits:
-            rule = rules.get(hit.rule_id, Rule(rule_id=hit.rule_id))
-            variant_multiplier = _VARIANT_FACTORS.get(hit.match_type, 1.0)
-            scope_multiplier = _scope_multiplier(rule)
-            raw_score = rule.weight * hit.strength * variant_multiplier * scope_multiplier
-
-            penalties_applied = _collect_penalties(hit, policy.penalties)
+            resolved = resolved_rules.get(hit.rule_id)
+            if resolved is None:
+                rule = rules.get(hit.rule_id, Rule(rule_id=hit.rule_id))
+                resolved = resolved_rules[hit.rule_id] = (rule, _scope_multiplier(rule))
+            rule, scope_multiplier = resolved
+            raw_score = rule.weight * hit.strength * variant_factors[hit.match_type_idx] * scope_multiplier
+
+            penalties_applied = _collect_penalties(hit, penalty_items, penalty_keys)
             total_penalty = sum(penalties_applied.values())
             adjusted_score = raw_score - total_penalty
             cumulative += adjusted_score
@@ -77,37 +116,35 @@ def score_clauses(
                 f"rule={hit.rule_id} ({hit.match_type}) => {adjusted_score:.3f}"
             )
 
-            for flag in rule.flags:
-                flags[flag] = True
+            if hit.rule_id not in seen_rules:
+                if not seen_rules or rule.priority > max_priority:
+                    max_priority = rule.priority
+                seen_rules.add(hit.rule_id)
+                flags.update(dict.fromkeys(rule.flags, True))
             for note in hit.notes:
                 note_key = note.split(":", 1)[-1]
                 if note_key in policy.penalties:
                     flags[note_key] = True
 
-            priorities.append(rule.priority)
             severities.append(rule.severity)
 
         confidence = max(0.0, min(1.0, cumulative))
         metadata = {
             "flags": flags,
-            "max_priority": max(priorities) if priorities else 0,
+            "max_priority": max_priority,
             "severities": severities,
             "scope_specificity": _best_scope_specificity(
                 rules, adopted_rules or suppressed_rules
             ),
         }
 
-        computations.append(
-            ClauseComputation(
-                clause_id=clause_id,
-                confidence=confidence,
-                per_hit_scores=per_hit_scores,
-                adopted_rules=adopted_rules,
-                suppressed_rules=suppressed_rules,
-                reasons=reasons,
-                metadata=metadata,
-            )
-        )
+        computations.clause_ids.append(clause_id)
+        computations.confidences.append(confidence)
+        computations.per_hit_scores.append(per_hit_scores)
+        computations.adopted_rules.append(adopted_rules)
+        computations.suppressed_rules.append(suppressed_rules)
+        computations.reasons.append(reasons)
+        computations.metadatas.append(metadata)
 
     return computations
 
@@ -122,20 +159,28 @@ def _scope_multiplier(rule: Rule) -> float:
     return multiplier
 
 
-def _collect_penalties(hit: Hit, penalties: Dict[str, float]) -> Dict[str, float]:
-    applied: Dict[str, float] = {}
+def _collect_penalties(
+    hit: Hit,
+    penalty_items: List[Tuple[str, str, float]],
+    penalty_keys: FrozenSet[str],
+) -> Dict[str, float]:
+    """Penalties triggered by a hit's notes or flags, in policy order.
+
+    ``penalty_items`` holds ``(name, lowercased name, penalty)`` triples and
+    ``penalty_keys`` the lowercased names; both are built once per scoring run.
+    """
     note_tokens = set()
-    for note in hit.notes:
-        lower = note.lower()
+    for lower in hit.notes_lower:
         note_tokens.add(lower)
-        note_tokens.add(lower.split(":", 1)[-1])
-    for name, penalty in penalties.items():
-        key = name.lower()
-        if key in note_tokens:
-            applied[name] = penalty
-        elif hit.flags and key in hit.flags and hit.flags.get(key):
-            applied[name] = penalty
-    return applied
+        colon = lower.find(":")
+        if colon >= 0:
+            note_tokens.add(lower[colon + 1 :])
+    matched = note_tokens & penalty_keys
+    if hit.flags:
+        matched.update(key for key in penalty_keys if hit.flags.get(key))
+    if not matched:
+        return {}
+    return {name: penalty for name, key, penalty in penalty_items if key in matched}
 
 
 def _best_scope_specificity(
@@ -157,4 +202,4 @@ def _best_scope_specificity(
     return best
 
 
-__all__ = ["ClauseComputation", "score_clauses"]
+__all__ = ["ClauseComputations", "score_clauses"]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+import sys
+from dataclasses import dataclass, field
 from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 DEFAULT_THRESHOLDS: Dict[str, float] = {
@@ -43,8 +44,12 @@ _SEVERITY_SYNONYMS = {
     "CRITICAL": "CRITICAL",
 }
 
+# Known match types; any other value maps to index len(MATCH_TYPES).
+MATCH_TYPES: Tuple[str, ...] = ("lex", "syntax", "num", "table")
+_MATCH_TYPE_IDX: Dict[str, int] = {name: idx for idx, name in enumerate(MATCH_TYPES)}
 
-@dataclass
+
+@dataclass(slots=True)
 class Hit:
     rule_id: str
     clause_id: str
@@ -55,6 +60,13 @@ class Hit:
     numeric_ctx: Optional[Dict[str, Any]] = None
     table_ctx: Optional[Dict[str, Any]] = None
     flags: Dict[str, Any] = field(default_factory=dict)
+    notes_lower: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    match_type_idx: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Penalty matching is case-insensitive; lowercase once per hit.
+        self.notes_lower = tuple(note.lower() for note in self.notes)
+        self.match_type_idx = _MATCH_TYPE_IDX.get(self.match_type, len(MATCH_TYPES))
 
     @classmethod
     def from_mapping(cls, payload: Dict[str, Any]) -> "Hit":
@@ -69,9 +81,11 @@ class Hit:
                 spans.append((int(start), int(end)))
         notes = list(payload.get("notes", []))
         flags = dict(payload.get("flags", {}))
+        # Ids key every grouping and rule lookup downstream; interning lets
+        # repeated ids share one object so dict probes short-circuit on identity.
         return cls(
-            rule_id=str(payload["rule_id"]),
-            clause_id=str(payload["clause_id"]),
+            rule_id=sys.intern(str(payload["rule_id"])),
+            clause_id=sys.intern(str(payload["clause_id"])),
             match_type=str(payload.get("match_type", "lex")),
             spans=spans,
             strength=float(payload.get("strength", 0.0)),
@@ -82,7 +96,7 @@ class Hit:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Rule:
     rule_id: str
     weight: float = 1.0
@@ -104,7 +118,7 @@ class Rule:
         else:
             flags = [str(flag) for flag in (flags_payload or [])]
         return cls(
-            rule_id=str(payload["rule_id"]),
+            rule_id=sys.intern(str(payload["rule_id"])),
             weight=float(payload.get("weight", 1.0)),
             priority=int(payload.get("priority", 0)),
             severity=severity,
@@ -113,7 +127,7 @@ class Rule:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CalibrationSettings:
     enable: bool = True
     target_warn_rate: float = 0.90
@@ -137,7 +151,7 @@ class CalibrationSettings:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Policy:
     thresholds: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_THRESHOLDS))
     penalties: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_PENALTIES))
@@ -164,7 +178,7 @@ class Policy:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PerHitScore:
     rule_id: str
     raw: float
@@ -175,11 +189,18 @@ class PerHitScore:
     adjusted: float
 
     def to_dict(self) -> Dict[str, Any]:
-        payload = asdict(self)
-        return payload
+        return {
+            "rule_id": self.rule_id,
+            "raw": self.raw,
+            "penalties_applied": self.penalties_applied,
+            "match_type": self.match_type,
+            "strength": self.strength,
+            "weight": self.weight,
+            "adjusted": self.adjusted,
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class ClauseScore:
     clause_id: str
     confidence: float
@@ -191,9 +212,18 @@ class ClauseScore:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
-        payload = asdict(self)
-        payload["per_hit_scores"] = [score.to_dict() for score in self.per_hit_scores]
-        return payload
+        # Shallow on purpose: the payload is serialized straight away, so the
+        # nested lists and metadata are shared rather than deep-copied.
+        return {
+            "clause_id": self.clause_id,
+            "confidence": self.confidence,
+            "risk_flag": self.risk_flag,
+            "reasons": self.reasons,
+            "adopted_rules": self.adopted_rules,
+            "suppressed_rules": self.suppressed_rules,
+            "per_hit_scores": [score.to_dict() for score in self.per_hit_scores],
+            "metadata": self.metadata,
+        }
 
 
 def hits_from_payload(payload: Any) -> List[Hit]:
@@ -231,4 +261,5 @@ __all__ = [
     "rules_from_payload",
     "DEFAULT_THRESHOLDS",
     "DEFAULT_PENALTIES",
+    "MATCH_TYPES",
 ]
\ No newline at end of file
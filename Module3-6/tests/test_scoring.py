@@ -68,6 +68,16 @@ def test_ambiguous_cases_excluded_from_warn_rate():
     assert negative_scores, "Expected at least one negative per-hit score for suppressed rule"
 
 
+def test_policy_from_mapping_returns_independent_instances():
+    first = Policy.from_mapping({})
+    first.thresholds["HIGH"] = 0.5
+    first.calibration.enable = False
+
+    second = Policy.from_mapping({})
+    assert second.thresholds["HIGH"] == 0.99
+    assert second.calibration.enable is True
+
+
 def test_cli_emits_scores(tmp_path):
     hits_path = SAMPLES / "hits.json"
     rules_path = SAMPLES / "ruleset_runtime.json"
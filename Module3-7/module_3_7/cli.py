@@ -52,11 +52,13 @@ def main(argv: list[str] | None = None) -> int:
     if indent is None:
         indent = 2
     args.out.parent.mkdir(parents=True, exist_ok=True)
+    # Encode in one shot and write once; json.dump issues a write per token.
+    if indent is not None:
+        text = json.dumps(payload, ensure_ascii=False, indent=indent)
+    else:
+        text = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
     with args.out.open("w", encoding=_UTF8) as handle:
-        if indent is not None:
-            json.dump(payload, handle, ensure_ascii=False, indent=indent)
-        else:
-            json.dump(payload, handle, ensure_ascii=False, separators=(",", ":"))
+        handle.write(text)
     return 0
 
 
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 import json
 import re
+import sys
 
 
 KNOWN_EFFECTS = {"OVERRIDE", "MITIGATE", "BOUND_BY", "CONFLICT", "DEPEND"}
@@ -20,6 +22,17 @@ DEFAULT_PRIORITIES = ["OVERRIDE", "CONFLICT", "MITIGATE", "BOUND_BY", "DEPEND"]
 DEFAULT_THRESHOLDS = {"mitigate_conf_min": 0.80, "mitigate_bonus": 0.05}
 DEFAULT_PHRASES = {"notwithstanding": "notwithstanding", "subject_to": "subject to"}
 
+# Compiled stand-in for the "*" wildcard in ``when`` clauses.
+_ANY = object()
+
+# Subjects of a compiled ``when`` condition.
+_EDGE, _THIS, _TARGET = 0, 1, 2
+_SUBJECT_PREFIXES = (("this.", _THIS), ("target.", _TARGET))
+
+# Attribute strings keyed by ``(id(clause), attr)``; the owner must keep the
+# clauses alive for as long as the cache is used.
+AttrCache = Dict[Tuple[int, str], str]
+
 
 @dataclass
 class PolicyRule:
@@ -28,25 +41,44 @@ class PolicyRule:
     when: Dict[str, Any]
     effect: str
     note: Optional[str] = None
+    when_compiled: List[Tuple[int, str, Any]] = field(init=False, repr=False, compare=False)
 
-    def matches(self, *, edge: str, this_clause: Any, other_clause: Any) -> bool:
+    def __post_init__(self) -> None:
+        # Keys and patterns are fixed for the life of the policy; resolve each
+        # condition once into (subject, attribute, compiled pattern).
+        self.when_compiled = []
         for key, expected in self.when.items():
             if key == "edge":
-                if not _match_value(expected, edge):
-                    return False
-                continue
-            if key.startswith("this."):
-                attr = key.split(".", 1)[1]
-                value = _lookup_attr(this_clause, attr)
-                if not _match_value(expected, value):
-                    return False
-                continue
-            if key.startswith("target."):
-                attr = key.split(".", 1)[1]
-                value = _lookup_attr(other_clause, attr)
-                if not _match_value(expected, value):
-                    return False
+                self.when_compiled.append((_EDGE, "", _compile_expected(expected)))
                 continue
+            for prefix, subject in _SUBJECT_PREFIXES:
+                if key.startswith(prefix):
+                    self.when_compiled.append((subject, key[len(prefix) :], _compile_expected(expected)))
+                    break
+
+    def matches(
+        self,
+        *,
+        edge: str,
+        this_clause: Any,
+        other_clause: Any,
+        attr_cache: Optional[AttrCache] = None,
+    ) -> bool:
+        for subject, attr, expected in self.when_compiled:
+            if subject == _EDGE:
+                value = edge
+            elif subject == _THIS:
+                value = _cached_attr(attr_cache, this_clause, attr)
+            else:
+                value = _cached_attr(attr_cache, other_clause, attr)
+            if not _match_value(expected, value):
+                return False
+        return True
+
+    def accepts_edge(self, edge: str) -> bool:
+        for subject, _, expected in self.when_compiled:
+            if subject == _EDGE and not _match_value(expected, edge):
+                return False
         return True
 
     def describe(self) -> str:
@@ -71,21 +103,44 @@ def _lookup_attr(obj: Any, attr: str) -> str:
         "id": "clause_id",
     }.get(attr, attr)
     value = getattr(obj, name, "")
-    if isinstance(value, list):
+    if isinstance(value, (list, tuple)):
         return " ".join(str(item) for item in value)
-    if isinstance(value, dict):
+    if isinstance(value, Mapping):
         return " ".join(f"{key}:{val}" for key, val in value.items())
     return str(value)
 
 
-def _match_value(expected: Any, value: Any) -> bool:
-    haystack = str(value)
+def _cached_attr(cache: Optional[AttrCache], obj: Any, attr: str) -> str:
+    if cache is None:
+        return _lookup_attr(obj, attr)
+    key = (id(obj), attr)
+    value = cache.get(key)
+    if value is None:
+        value = cache[key] = _lookup_attr(obj, attr)
+    return value
+
+
+def _compile_expected(expected: Any) -> Any:
     if expected is None:
-        return False
+        return None
     pattern = str(expected)
     if pattern == "*":
+        return _ANY
+    try:
+        return re.compile(pattern, flags=re.IGNORECASE)
+    except re.error:
+        # Leave invalid patterns as text so they still fail only when evaluated.
+        return pattern
+
+
+def _match_value(expected: Any, value: Any) -> bool:
+    if expected is None:
+        return False
+    if expected is _ANY:
         return True
-    return bool(re.search(pattern, haystack, flags=re.IGNORECASE))
+    if isinstance(expected, re.Pattern):
+        return expected.search(str(value)) is not None
+    return bool(re.search(str(expected), str(value), flags=re.IGNORECASE))
 
 
 class ContextPolicy:
@@ -99,16 +154,24 @@ class ContextPolicy:
         default_effects: Dict[str, str],
     ) -> None:
         self._rules = rules
+        # Rules whose edge condition admits a relation type, in policy order.
+        self._rules_by_edge: Dict[str, Tuple[PolicyRule, ...]] = {}
         self.thresholds = {**DEFAULT_THRESHOLDS, **thresholds}
         self.priorities = priorities or DEFAULT_PRIORITIES
+        self.priority_index: Dict[str, int] = {name: idx for idx, name in enumerate(self.priorities)}
+        self.priority_fallback = len(self.priority_index)
         self.phrases = {**DEFAULT_PHRASES, **phrases}
         self.default_effects = {**DEFAULT_EFFECT_MAP, **default_effects}
 
     @classmethod
     def from_file(cls, path: Path) -> "ContextPolicy":
-        with path.open("r", encoding="utf-8") as handle:
-            raw_data = json.load(handle)
-        return cls.from_dict(raw_data)
+        """Load a policy, reusing the parsed rules while the file is unchanged.
+
+        Every call returns a new policy; only the compiled rules are shared.
+        """
+        resolved = Path(path).resolve()
+        stat = resolved.stat()
+        return _load_policy_cached(cls, resolved, stat.st_mtime_ns, stat.st_size)._copy()
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "ContextPolicy":
@@ -121,7 +184,7 @@ class ContextPolicy:
                         section=section,
                         index=idx,
                         when=dict(entry.get("when", {})),
-                        effect=str(entry.get("effect", "")),
+                        effect=sys.intern(str(entry.get("effect", ""))),
                         note=entry.get("note"),
                     )
                 )
@@ -137,10 +200,33 @@ class ContextPolicy:
             default_effects=defaults,
         )
 
-    def decide(self, relation_type: str, *, this_clause: Any, other_clause: Any) -> PolicyDecision:
+    def _copy(self) -> "ContextPolicy":
+        # The constructor already merges thresholds, phrases and default
+        # effects into new dicts; priorities need their own list.
+        return type(self)(
+            rules=self._rules,
+            thresholds=self.thresholds,
+            priorities=list(self.priorities),
+            phrases=self.phrases,
+            default_effects=self.default_effects,
+        )
+
+    def decide(
+        self,
+        relation_type: str,
+        *,
+        this_clause: Any,
+        other_clause: Any,
+        attr_cache: Optional[AttrCache] = None,
+    ) -> PolicyDecision:
         notes: List[str] = []
-        for rule in self._rules:
-            if not rule.matches(edge=relation_type, this_clause=this_clause, other_clause=other_clause):
+        for rule in self.rules_for_edge(relation_type):
+            if not rule.matches(
+                edge=relation_type,
+                this_clause=this_clause,
+                other_clause=other_clause,
+                attr_cache=attr_cache,
+            ):
                 continue
             effect = rule.effect if rule.effect in KNOWN_EFFECTS else None
             rationale = rule.describe()
@@ -157,5 +243,18 @@ class ContextPolicy:
             return PolicyDecision(effect=None, rationale=rationale, notes=notes)
         return PolicyDecision(effect=default_effect, rationale=rationale, notes=notes)
 
+    def rules_for_edge(self, relation_type: str) -> Tuple[PolicyRule, ...]:
+        """Rules that can fire for ``relation_type``, in policy order."""
+        rules = self._rules_by_edge.get(relation_type)
+        if rules is None:
+            rules = tuple(rule for rule in self._rules if rule.accepts_edge(relation_type))
+            self._rules_by_edge[relation_type] = rules
+        return rules
+
+
+@lru_cache(maxsize=16)
+def _load_policy_cached(cls: type, path: Path, mtime_ns: int, size: int) -> ContextPolicy:
+    return cls.from_dict(json.loads(path.read_bytes()))
+
 
 __all__ = ["ContextPolicy", "PolicyDecision", "PolicyRule", "KNOWN_EFFECTS"]
\ No newline at end of file
@@ -157,13 +157,18 @@ class ContextResolver:
     # ... remainder unchanged ...om __future__ import annotations
 
 from collections import defaultdict
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Set, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple
 import json
 import re
+import sys
 
 from . import schemas
-from .policy import ContextPolicy, PolicyDecision
+from .policy import AttrCache, ContextPolicy, PolicyDecision
 
 ANNEX_KEYWORDS = ("annex", "appendix", "schedule", "exhibit")
 EXCEPTION_KEYWORDS = ("exception", "except", "carve-out")
@@ -176,6 +181,15 @@ EFFECT_AUDIENCE = {
     "DEFINITION_LINK": "source",
     "REF_ARTICLE": "source",
 }
+# (relation, counterpart clause, counterpart id) for a clause an effect lands on.
+_Applicable = Tuple[schemas.Relation, schemas.Clause, str]
+_RISK_INDEX = {flag: idx for idx, flag in enumerate(RISK_ORDER)}
+# Effects that turn any flag into AMBIG; AMBIG is then left alone by every effect.
+_AMBIG_EFFECTS = frozenset({"CONFLICT", "DEPEND"})
+# Bracketed ids and "clause N" mentions in one pass. The bracket branch only
+# consumes "[" (the id sits in a lookahead) so a "clause N" inside brackets is
+# still seen, exactly as with two separate scans.
+_TEXT_TARGETS = re.compile(r"\[(?=(?P<ref>[A-Za-z0-9_-]+)\])|(?i:clause)\s*(?P<num>\d{1,4})")
 
 
 class ContextResolver:
@@ -186,13 +200,28 @@ class ContextResolver:
         scores: Dict[str, schemas.Score],
         hits: Sequence[schemas.Hit],
         policy: ContextPolicy,
-        ruleset: Optional[dict] = None,
+        ruleset: Optional[Mapping[str, Any]] = None,
     ) -> None:
         self.clauses = clauses
         self.scores = scores
         self.hits = list(hits)
         self.policy = policy
         self.ruleset = ruleset or {}
+        # Clause attribute strings for policy matching; clauses stay alive in
+        # ``self.clauses`` for the resolver's lifetime, so id() keys are stable.
+        self._attr_cache: AttrCache = {}
+        self._sorted_clause_ids: Tuple[str, ...] = tuple(sorted(self.clauses))
+        self._mitigate_min = float(self.policy.thresholds.get("mitigate_conf_min", 0.80))
+        self._mitigate_bonus = float(self.policy.thresholds.get("mitigate_bonus", 0.0))
+        # (relation type, configured phrase, lowercased phrase) in match order.
+        self._phrase_cues: List[Tuple[str, str, str]] = [
+            (relation_type, phrase, phrase.lower())
+            for relation_type, phrase in (
+                ("NOTWITHSTANDING", self.policy.phrases.get("notwithstanding")),
+                ("SUBJECT_TO", self.policy.phrases.get("subject_to")),
+            )
+            if phrase
+        ]
 
         self._relations: List[schemas.Relation] = self._build_relations()
         self._relations_by_source: Dict[str, List[schemas.Relation]] = defaultdict(list)
@@ -200,6 +229,7 @@ class ContextResolver:
         for relation in self._relations:
             self._relations_by_source[relation.source_id].append(relation)
             self._relations_by_target[relation.target_id].append(relation)
+        self._applicable: Dict[str, List[_Applicable]] = self._index_applicable_relations()
 
     @classmethod
     def from_files(
@@ -219,17 +249,22 @@ class ContextResolver:
         policy = ContextPolicy.from_file(policy_path)
         ruleset = {}
         if ruleset_path and ruleset_path.exists():
-            with ruleset_path.open("r", encoding="utf-8") as handle:
-                ruleset = json.load(handle)
+            ruleset = _load_ruleset(ruleset_path)
         return cls(clauses=clauses, scores=scores, hits=hits, policy=policy, ruleset=ruleset)
 
     def resolve(self) -> Dict[str, object]:
-        results: List[schemas.ContextResolution] = []
+        # Each resolution is serialized as soon as it is built, so only the
+        # output dicts are held for the whole run.
+        results: List[Dict[str, object]] = []
         effect_counts: Dict[str, int] = defaultdict(int)
         changed: List[str] = []
         unchanged: List[str] = []
+        decide = self.policy.decide
+        attr_cache = self._attr_cache
+        priority_index = self.policy.priority_index
+        priority_fallback = self.policy.priority_fallback
 
-        for clause_id in sorted(self.clauses.keys()):
+        for clause_id in self._sorted_clause_ids:
             clause = self.clauses[clause_id]
             score = self.scores.get(
                 clause_id,
@@ -240,33 +275,41 @@ class ContextResolver:
                 key=lambda rel: (rel.relation_type, rel.target_id),
             )
             applicable_relations = self._collect_applicable_relations(clause_id)
-            effects: List[schemas.EffectRecord] = []
-            policy_notes: List[str] = []
+            # (priority, counterpart id, arrival, effect); arrival keeps ties stable.
+            keyed_effects: List[Tuple[int, str, int, schemas.EffectRecord]] = []
+            policy_notes: Dict[str, None] = {}
 
-            for relation, other_clause in applicable_relations:
-                decision = self.policy.decide(
+            for relation, other_clause, counterpart_id in applicable_relations:
+                decision = decide(
                     relation_type=relation.relation_type,
                     this_clause=clause,
                     other_clause=other_clause,
+                    attr_cache=attr_cache,
                 )
                 if decision.notes:
-                    policy_notes.extend(decision.notes)
+                    policy_notes.update(dict.fromkeys(decision.notes))
                 if not decision.effect:
                     continue
-                counterpart_id = _counterpart_id(relation, clause_id)
                 rationale = self._build_rationale(relation, decision)
                 evidence = self._build_evidence(primary=clause, counterpart=other_clause)
-                effects.append(
-                    schemas.EffectRecord(
-                        effect_type=decision.effect,
-                        target_clause_id=counterpart_id,
-                        rationale=rationale,
-                        evidence=evidence,
+                record = schemas.EffectRecord(
+                    effect_type=decision.effect,
+                    target_clause_id=counterpart_id,
+                    rationale=rationale,
+                    evidence=evidence,
+                )
+                keyed_effects.append(
+                    (
+                        priority_index.get(decision.effect, priority_fallback),
+                        counterpart_id,
+                        len(keyed_effects),
+                        record,
                     )
                 )
                 effect_counts[decision.effect] += 1
 
-            effects = self._sort_effects(effects)
+            keyed_effects.sort()
+            effects = [item[3] for item in keyed_effects]
             contextual_flag = self._derive_contextual_flag(score, effects)
 
             resolution = schemas.ContextResolution(
@@ -276,7 +319,7 @@ class ContextResolver:
                 relations=outgoing,
                 effects=effects,
                 contextual_risk_flag=contextual_flag,
-                policy_notes=sorted(set(policy_notes)),
+                policy_notes=sorted(policy_notes),
                 graph_degree_out=len(outgoing),
                 graph_degree_in=len(self._relations_by_target.get(clause_id, [])),
             )
@@ -284,35 +327,42 @@ class ContextResolver:
                 changed.append(clause_id)
             else:
                 unchanged.append(clause_id)
-            results.append(resolution)
+            results.append(resolution.to_dict())
 
         summary = {
             "counts_by_effect": {key: effect_counts[key] for key in sorted(effect_counts.keys())},
-            "changed_flags": sorted(changed),
-            "unchanged_flags": sorted(unchanged),
+            # Clauses are visited in id order, so both lists are already sorted.
+            "changed_flags": changed,
+            "unchanged_flags": unchanged,
         }
         return {
-            "results": [item.to_dict() for item in results],
+            "results": results,
             "summary": summary,
         }
 
-    def _collect_applicable_relations(self, clause_id: str) -> List[Tuple[schemas.Relation, schemas.Clause]]:
-        items: List[Tuple[schemas.Relation, schemas.Clause]] = []
-        for relation in self._relations_by_source.get(clause_id, []):
-            audience = EFFECT_AUDIENCE.get(relation.relation_type, "source")
-            if audience != "source":
+    def _collect_applicable_relations(self, clause_id: str) -> Sequence[_Applicable]:
+        return self._applicable.get(clause_id, ())
+
+    def _index_applicable_relations(self) -> Dict[str, List[_Applicable]]:
+        """Relations whose effect lands on each clause, with the counterpart resolved.
+
+        Per clause, relations it is the source of come first, then relations it
+        is the target of, each in relation order.
+        """
+        applicable: Dict[str, List[_Applicable]] = defaultdict(list)
+        for relation in self._relations:
+            if EFFECT_AUDIENCE.get(relation.relation_type, "source") != "source":
                 continue
             counterpart = self.clauses.get(relation.target_id)
             if counterpart:
-                items.append((relation, counterpart))
-        for relation in self._relations_by_target.get(clause_id, []):
-            audience = EFFECT_AUDIENCE.get(relation.relation_type, "source")
-            if audience != "target":
+                applicable[relation.source_id].append((relation, counterpart, relation.target_id))
+        for relation in self._relations:
+            if EFFECT_AUDIENCE.get(relation.relation_type, "source") != "target":
                 continue
             counterpart = self.clauses.get(relation.source_id)
             if counterpart:
-                items.append((relation, counterpart))
-        return items
+                applicable[relation.target_id].append((relation, counterpart, relation.source_id))
+        return applicable
 
     def _derive_contextual_flag(
         self,
@@ -321,40 +371,24 @@ class ContextResolver:
     ) -> Optional[str]:
         if not effects:
             return None
-        current_flag = score.risk_flag
-        confidence = score.confidence
+        # Folding the effects in order reduces to: any CONFLICT/DEPEND yields
+        # AMBIG (which absorbs everything after it), otherwise the flag steps
+        # down once per OVERRIDE and per MITIGATE that clears the threshold.
+        mitigates = score.confidence + self._mitigate_bonus >= self._mitigate_min
+        steps = 0
         for effect in effects:
-            current_flag = self._apply_effect(current_flag, confidence, effect.effect_type)
+            effect_upper = effect.effect_type.upper()
+            if effect_upper in _AMBIG_EFFECTS:
+                current_flag = "AMBIG"
+                break
+            if effect_upper == "OVERRIDE" or (effect_upper == "MITIGATE" and mitigates):
+                steps += 1
+        else:
+            current_flag = _step_down_risk(score.risk_flag, steps)
         if current_flag == score.risk_flag:
             return None
         return current_flag
 
-    def _apply_effect(self, flag: str, confidence: float, effect: str) -> str:
-        effect_upper = effect.upper()
-        if effect_upper == "OVERRIDE":
-            return _step_down_risk(flag)
-        if effect_upper == "MITIGATE":
-            threshold = float(self.policy.thresholds.get("mitigate_conf_min", 0.80))
-            bonus = float(self.policy.thresholds.get("mitigate_bonus", 0.0))
-            if confidence + bonus >= threshold:
-                return _step_down_risk(flag)
-            return flag
-        if effect_upper == "CONFLICT":
-            return "AMBIG"
-        if effect_upper == "DEPEND":
-            return "AMBIG"
-        return flag
-
-    def _sort_effects(self, effects: Sequence[schemas.EffectRecord]) -> List[schemas.EffectRecord]:
-        priority_index = {name: idx for idx, name in enumerate(self.policy.priorities)}
-        return sorted(
-            effects,
-            key=lambda eff: (
-                priority_index.get(eff.effect_type, len(priority_index)),
-                eff.target_clause_id,
-            ),
-        )
-
     def _build_rationale(self, relation: schemas.Relation, decision: PolicyDecision) -> str:
         return f"{relation.relation_type} via {decision.rationale}"
 
@@ -370,22 +404,24 @@ class ContextResolver:
         )
 
     def _build_relations(self) -> List[schemas.Relation]:
-        relations: Dict[Tuple[str, str, str], schemas.Relation] = {}
-        for clause in self.clauses.values():
-            targets = self._collect_targets(clause)
-            for target_id, relation_type, cue in targets:
-                if target_id not in self.clauses:
-                    continue
-                key = (clause.clause_id, target_id, relation_type)
-                if key in relations:
-                    continue
-                relations[key] = schemas.Relation(
-                    source_id=clause.clause_id,
-                    target_id=target_id,
-                    relation_type=relation_type,
-                    cue=cue,
-                )
-        return sorted(relations.values(), key=lambda rel: (rel.source_id, rel.relation_type, rel.target_id))
+        # Visiting sources in id order leaves only a small sort per source.
+        relations: List[schemas.Relation] = []
+        clause_key = attrgetter("clause_id")
+        for source_id, clauses in groupby(sorted(self.clauses.values(), key=clause_key), key=clause_key):
+            source_relations: Dict[Tuple[str, str], schemas.Relation] = {}
+            for clause in clauses:
+                for target_id, relation_type, cue in self._collect_targets(clause):
+                    key = (target_id, relation_type)
+                    if key in source_relations:
+                        continue
+                    source_relations[key] = schemas.Relation(
+                        source_id=source_id,
+                        target_id=target_id,
+                        relation_type=relation_type,
+                        cue=cue,
+                    )
+            relations.extend(sorted(source_relations.values(), key=lambda rel: (rel.relation_type, rel.target_id)))
+        return relations
 
     def _collect_targets(self, clause: schemas.Clause) -> List[Tuple[str, str, Optional[str]]]:
         targets: Set[str] = set()
@@ -393,9 +429,20 @@ class ContextResolver:
         targets.update(self._targets_from_tags(clause))
         targets.update(self._targets_from_bindings(clause))
         targets.update(self._targets_from_text(clause))
+        # The phrase/keyword fallback depends only on the clause text, so it is
+        # worked out at most once per clause rather than once per target.
+        text_relation: Optional[Tuple[str, Optional[str]]] = None
+        # Only known clauses become relations; drop the rest before inference.
         for target in targets:
-            relation_type, cue = self._infer_relation_type(clause, target)
-            annotations.append((target, relation_type, cue))
+            if target not in self.clauses:
+                continue
+            relation = self._explicit_relation_type(clause, target)
+            if relation is None:
+                if text_relation is None:
+                    text_relation = self._text_relation_type(clause.normalized_text.lower())
+                relation = text_relation
+            relation_type, cue = relation
+            annotations.append((sys.intern(target), relation_type, cue))
         return annotations
 
     def _targets_from_tags(self, clause: schemas.Clause) -> Set[str]:
@@ -413,29 +460,35 @@ class ContextResolver:
 
     def _targets_from_text(self, clause: schemas.Clause) -> Set[str]:
         text = clause.normalized_text
-        targets: Set[str] = set(re.findall(r"\[([A-Za-z0-9_-]+)\]", text))
-        for number in re.findall(r"clause\s*(\d{1,4})", text, flags=re.IGNORECASE):
-            candidate = f"C-{number}"
+        targets: Set[str] = set()
+        for match in _TEXT_TARGETS.finditer(text):
+            ref = match.group("ref")
+            if ref is not None:
+                targets.add(ref)
+                continue
+            candidate = f"C-{match.group('num')}"
             if candidate in self.clauses:
                 targets.add(candidate)
         return targets
 
-    def _infer_relation_type(self, clause: schemas.Clause, target: str) -> Tuple[str, Optional[str]]:
-        norm_text = clause.normalized_text
+    def _explicit_relation_type(self, clause: schemas.Clause, target: str) -> Optional[Tuple[str, Optional[str]]]:
+        """Relation type stated by the clause's tags or bindings for ``target``, if any."""
+        annex_tag = f"annex:{target}"
+        exception_tag = f"exception:{target}"
         for tag in clause.tags:
-            if tag == f"annex:{target}":
+            if tag == annex_tag:
                 return "ANNEX_REF", "annex"
-            if tag == f"exception:{target}":
+            if tag == exception_tag:
                 return "EXCEPTION_LINK", "exception"
         if target in clause.def_bindings.values():
             return "DEFINITION_LINK", "definition"
-        phrase = self.policy.phrases.get("notwithstanding")
-        if phrase and phrase.lower() in norm_text.lower():
-            return "NOTWITHSTANDING", phrase
-        subj_phrase = self.policy.phrases.get("subject_to")
-        if subj_phrase and subj_phrase.lower() in norm_text.lower():
-            return "SUBJECT_TO", subj_phrase
-        lowered = norm_text.lower()
+        return None
+
+    def _text_relation_type(self, lowered: str) -> Tuple[str, Optional[str]]:
+        """Relation type implied by the clause's lowercased normalized text."""
+        for relation_type, phrase, phrase_lower in self._phrase_cues:
+            if phrase_lower in lowered:
+                return relation_type, phrase
         for keyword in ANNEX_KEYWORDS:
             if keyword in lowered:
                 return "ANNEX_REF", keyword
@@ -445,8 +498,28 @@ class ContextResolver:
         return "REF_ARTICLE", None
 
 
-def _counterpart_id(relation: schemas.Relation, clause_id: str) -> str:
-    return relation.target_id if relation.source_id == clause_id else relation.source_id
+def _load_ruleset(path: Path) -> Mapping[str, Any]:
+    """Parse a ruleset file, reusing the previous result while it is unchanged.
+
+    The payload is shared between resolvers, so it is returned read-only, with
+    mappings as ``MappingProxyType`` views and arrays as tuples.
+    """
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    return _load_ruleset_cached(resolved, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=16)
+def _load_ruleset_cached(path: Path, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    return _freeze_json(json.loads(path.read_bytes()))
+
+
+def _freeze_json(value: Any) -> Any:
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze_json(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(map(_freeze_json, value))
+    return value
 
 
 def _trim_sentence(text: str, *, limit: int = 120) -> str:
@@ -456,13 +529,11 @@ def _trim_sentence(text: str, *, limit: int = 120) -> str:
     return snippet[: limit - 3] + "..."
 
 
-def _step_down_risk(flag: str) -> str:
-    if flag not in RISK_ORDER:
-        return flag
-    index = RISK_ORDER.index(flag)
-    if index >= len(RISK_ORDER) - 1:
+def _step_down_risk(flag: str, steps: int = 1) -> str:
+    index = _RISK_INDEX.get(flag)
+    if index is None or not steps:
         return flag
-    return RISK_ORDER[index + 1]
+    return RISK_ORDER[min(index + steps, len(RISK_ORDER) - 1)]
 
 
 __all__ = ["ContextResolver"]
\ No newline at end of file
@@ -1,81 +1,109 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, TypeVar
 import json
+import sys
 
-_UTF8_SIG = "utf-8-sig"
+_T = TypeVar("_T")
 
+_EMPTY_MAPPING: Mapping[Any, Any] = MappingProxyType({})
 
-@dataclass
+
+# Loaded records are cached and shared between callers, so their list and
+# dict fields are stored as tuples and read-only mappings.
+def _as_tuple(value: Any) -> Tuple[Any, ...]:
+    return tuple(value) if value else ()
+
+
+def _as_mapping(value: Any) -> Mapping[Any, Any]:
+    # A decoded JSON object is wrapped without copying; the payload is not
+    # used again.
+    if type(value) is dict:
+        return MappingProxyType(value) if value else _EMPTY_MAPPING
+    return MappingProxyType(dict(value)) if value else _EMPTY_MAPPING
+
+
+@dataclass(frozen=True, slots=True)
 class Clause:
     clause_id: str
     index_path: str
     text: str
     normalized_text: str
     title: str
-    tags: List[str]
+    tags: Tuple[str, ...]
     category: str
     subcategory: str
-    canonical_terms: List[str]
-    def_bindings: Dict[str, str]
+    canonical_terms: Tuple[str, ...]
+    def_bindings: Mapping[str, str]
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "Clause":
+        # Clause ids key every index in the resolver; interned ids let the
+        # score, relation and bucket lookups compare by identity. Categories
+        # come from a small vocabulary, so they are interned as well.
+        get = payload.get
+        text = get("text", "")
         return cls(
-            clause_id=str(payload.get("id") or payload.get("clause_id") or ""),
-            index_path=str(payload.get("index_path", "")),
-            text=str(payload.get("text", "")),
-            normalized_text=str(payload.get("normalized_text", payload.get("text", ""))),
-            title=str(payload.get("title", "")),
-            tags=list(payload.get("tags", []) or []),
-            category=str(payload.get("category", "UNKNOWN")),
-            subcategory=str(payload.get("subcategory", "")),
-            canonical_terms=list(payload.get("canonical_terms", []) or []),
-            def_bindings=dict(payload.get("def_bindings", {}) or {}),
+            clause_id=sys.intern(str(get("id") or get("clause_id") or "")),
+            index_path=str(get("index_path", "")),
+            text=str(text),
+            normalized_text=str(get("normalized_text", text)),
+            title=str(get("title", "")),
+            tags=_as_tuple(get("tags")),
+            category=sys.intern(str(get("category", "UNKNOWN"))),
+            subcategory=sys.intern(str(get("subcategory", ""))),
+            canonical_terms=_as_tuple(get("canonical_terms")),
+            def_bindings=_as_mapping(get("def_bindings")),
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Score:
     clause_id: str
     confidence: float
     risk_flag: str
-    adopted_rules: List[str] = field(default_factory=list)
-    reasons: List[str] = field(default_factory=list)
+    adopted_rules: Tuple[str, ...] = ()
+    reasons: Tuple[str, ...] = ()
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "Score":
+        get = payload.get
         return cls(
-            clause_id=str(payload["clause_id"]),
-            confidence=float(payload.get("confidence", 0.0)),
-            risk_flag=str(payload.get("risk_flag", "AMBIG")),
-            adopted_rules=list(payload.get("adopted_rules", []) or []),
-            reasons=list(payload.get("reasons", []) or []),
+            clause_id=sys.intern(str(payload["clause_id"])),
+            confidence=float(get("confidence", 0.0)),
+            risk_flag=sys.intern(str(get("risk_flag", "AMBIG"))),
+            adopted_rules=_as_tuple(get("adopted_rules")),
+            reasons=_as_tuple(get("reasons")),
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Hit:
     rule_id: str
     clause_id: str
     match_type: str
-    spans: List[Dict[str, Any]]
+    spans: Tuple[Mapping[str, Any], ...]
     strength: float
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "Hit":
+        get = payload.get
         return cls(
-            rule_id=str(payload.get("rule_id", "")),
-            clause_id=str(payload.get("clause_id", "")),
-            match_type=str(payload.get("match_type", "")),
-            spans=list(payload.get("spans", []) or []),
-            strength=float(payload.get("strength", 0.0)),
+            rule_id=sys.intern(str(get("rule_id", ""))),
+            clause_id=str(get("clause_id", "")),
+            match_type=sys.intern(str(get("match_type", ""))),
+            spans=tuple(
+                MappingProxyType(span) if type(span) is dict else span for span in get("spans") or ()
+            ),
+            strength=float(get("strength", 0.0)),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Relation:
     source_id: str
     target_id: str
@@ -83,30 +111,28 @@ class Relation:
     cue: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        data: Dict[str, Any] = {
-            "type": self.relation_type,
-            "target_clause_id": self.target_id,
-        }
         if self.cue:
-            data["cue"] = self.cue
-        return data
+            return {"type": self.relation_type, "target_clause_id": self.target_id, "cue": self.cue}
+        return {"type": self.relation_type, "target_clause_id": self.target_id}
 
 
-@dataclass
+@dataclass(slots=True)
 class Evidence:
     source_snippet: Optional[str] = None
     target_snippet: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        payload: Dict[str, Any] = {}
-        if self.source_snippet:
-            payload["source_snippet"] = self.source_snippet
-        if self.target_snippet:
-            payload["target_snippet"] = self.target_snippet
-        return payload
+        source, target = self.source_snippet, self.target_snippet
+        if source and target:
+            return {"source_snippet": source, "target_snippet": target}
+        if source:
+            return {"source_snippet": source}
+        if target:
+            return {"target_snippet": target}
+        return {}
 
 
-@dataclass
+@dataclass(slots=True)
 class EffectRecord:
     effect_type: str
     target_clause_id: str
@@ -114,19 +140,22 @@ class EffectRecord:
     evidence: Optional[Evidence] = None
 
     def to_dict(self) -> Dict[str, Any]:
-        data: Dict[str, Any] = {
+        evidence = self.evidence.to_dict() if self.evidence else None
+        if evidence:
+            return {
+                "type": self.effect_type,
+                "target_clause_id": self.target_clause_id,
+                "rationale": self.rationale,
+                "evidence": evidence,
+            }
+        return {
             "type": self.effect_type,
             "target_clause_id": self.target_clause_id,
             "rationale": self.rationale,
         }
-        if self.evidence:
-            evidence_dict = self.evidence.to_dict()
-            if evidence_dict:
-                data["evidence"] = evidence_dict
-        return data
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextResolution:
     clause_id: str
     base_risk_flag: str
@@ -139,50 +168,112 @@ class ContextResolution:
     graph_degree_in: int = 0
 
     def to_dict(self) -> Dict[str, Any]:
-        payload: Dict[str, Any] = {
+        # Same payloads as Relation.to_dict and EffectRecord.to_dict, built
+        # inline because this runs for every relation and effect in a report.
+        relations = [
+            {"type": relation.relation_type, "target_clause_id": relation.target_id, "cue": relation.cue}
+            if relation.cue
+            else {"type": relation.relation_type, "target_clause_id": relation.target_id}
+            for relation in self.relations
+        ]
+        effects = [
+            {
+                "type": effect.effect_type,
+                "target_clause_id": effect.target_clause_id,
+                "rationale": effect.rationale,
+                "evidence": evidence,
+            }
+            if effect.evidence and (evidence := effect.evidence.to_dict())
+            else {
+                "type": effect.effect_type,
+                "target_clause_id": effect.target_clause_id,
+                "rationale": effect.rationale,
+            }
+            for effect in self.effects
+        ]
+        degree = {"out": self.graph_degree_out, "in": self.graph_degree_in}
+        if self.contextual_risk_flag:
+            return {
+                "clause_id": self.clause_id,
+                "base_risk_flag": self.base_risk_flag,
+                "base_confidence": self.base_confidence,
+                "relations": relations,
+                "effects": effects,
+                "policy_notes": list(self.policy_notes),
+                "graph_degree": degree,
+                "contextual_risk_flag": self.contextual_risk_flag,
+            }
+        return {
             "clause_id": self.clause_id,
             "base_risk_flag": self.base_risk_flag,
             "base_confidence": self.base_confidence,
-            "relations": [relation.to_dict() for relation in self.relations],
-            "effects": [effect.to_dict() for effect in self.effects],
+            "relations": relations,
+            "effects": effects,
             "policy_notes": list(self.policy_notes),
-            "graph_degree": {"out": self.graph_degree_out, "in": self.graph_degree_in},
+            "graph_degree": degree,
         }
-        if self.contextual_risk_flag:
-            payload["contextual_risk_flag"] = self.contextual_risk_flag
-        return payload
 
 
 def _load_json(path: Path) -> Any:
-    with path.open("r", encoding=_UTF8_SIG) as handle:
-        return json.load(handle)
+    # json.loads detects (and strips) a UTF-8 BOM on bytes input and parses
+    # with the json module's shared default decoder.
+    return json.loads(path.read_bytes())
+
+
+def _load_cached(parse: Callable[[Path], _T], path: Path) -> _T:
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    return _parse_cached(parse, resolved, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=32)
+def _parse_cached(parse: Callable[[Path], Any], path: Path, mtime_ns: int, size: int) -> Any:
+    return parse(path)
 
 
 def load_clauses(path: Path) -> Dict[str, Clause]:
+    """Load clauses by id, reusing the parsed records while the file is unchanged.
+
+    The container is fresh on every call. The records are shared between
+    callers, so they are frozen and hold only tuples and read-only mappings.
+    The same holds for ``load_scores`` and ``load_hits``.
+    """
+    return dict(_load_cached(_parse_clauses, path))
+
+
+def load_scores(path: Path) -> Dict[str, Score]:
+    return dict(_load_cached(_parse_scores, path))
+
+
+def load_hits(path: Path) -> List[Hit]:
+    return list(_load_cached(_parse_hits, path))
+
+
+def _parse_clauses(path: Path) -> Dict[str, Clause]:
     data = _load_json(path)
     if isinstance(data, dict):
+        # The chain is lazy, and an empty "clauses" list deliberately falls
+        # through to the next candidate, so key-presence branches would differ.
         data = data.get("clauses") or data.get("norm_clauses") or list(data.values())
     if not isinstance(data, list):
         raise ValueError(f"clauses payload must be a list, received {type(data)!r}")
-    clauses = [Clause.from_dict(item) for item in data]
-    return {clause.clause_id: clause for clause in clauses}
+    return {(clause := Clause.from_dict(item)).clause_id: clause for item in data}
 
 
-def load_scores(path: Path) -> Dict[str, Score]:
+def _parse_scores(path: Path) -> Dict[str, Score]:
     data = _load_json(path)
     if not isinstance(data, list):
         raise ValueError("scores must be a list of per-clause objects")
-    scores = [Score.from_dict(item) for item in data]
-    return {score.clause_id: score for score in scores}
+    return {(score := Score.from_dict(item)).clause_id: score for item in data}
 
 
-def load_hits(path: Path) -> List[Hit]:
+def _parse_hits(path: Path) -> Tuple[Hit, ...]:
     data = _load_json(path)
     if isinstance(data, dict) and "hits" in data:
         data = data.get("hits", [])
-    if not isinstance(data, Iterable):
-        raise ValueError("hits payload must be iterable")
-    return [Hit.from_dict(item) for item in data]
+    if not isinstance(data, list):
+        raise ValueError(f"hits payload must be a list, received {type(data)!r}")
+    return tuple(map(Hit.from_dict, data))
 
 
 __all__ = [
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import json
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
 import pytest
 
 from module_3_7.cli import main as cli_main
+from module_3_7.policy import ContextPolicy
 from module_3_7.resolver import ContextResolver
+from module_3_7.schemas import Clause, load_clauses
 
 
 @pytest.fixture(scope="module")
@@ -52,6 +55,117 @@ def test_resolver_applies_context_effects(samples_dir: Path) -> None:
     assert summary["unchanged_flags"] == ["C-101", "C-202"]
 
 
+def test_policy_edge_filter_keeps_rule_order() -> None:
+    policy = ContextPolicy.from_dict(
+        {
+            "custom": [
+                {"when": {"edge": "REF"}, "effect": "note-a"},
+                {"when": {"edge": "ANNEX_REF"}, "effect": "DEPEND"},
+                {"when": {"this.category": "MONEY"}, "effect": "OVERRIDE"},
+                {"when": {"edge": None}, "effect": "CONFLICT"},
+            ]
+        }
+    )
+
+    decision = policy.decide("annex_ref", this_clause=None, other_clause=None)
+    assert decision.effect == "DEPEND"
+    assert decision.notes == ["note-a"]
+
+    decision = policy.decide("SUBJECT_TO", this_clause=None, other_clause=None)
+    assert decision.effect == "BOUND_BY"
+    assert decision.rationale == "default:subject_to"
+
+
+def test_policy_matches_joined_sequence_and_mapping_fields() -> None:
+    policy = ContextPolicy.from_dict(
+        {
+            "custom": [
+                {"when": {"edge": "REF", "this.tags": "^a b$"}, "effect": "CONFLICT"},
+                {"when": {"edge": "REF", "this.def_bindings": "^k:v$"}, "effect": "OVERRIDE"},
+            ]
+        }
+    )
+    tagged = Clause.from_dict({"id": "c1", "tags": ["a", "b"]})
+    bound = Clause.from_dict({"id": "c2", "def_bindings": {"k": "v"}})
+
+    assert policy.decide("REF", this_clause=tagged, other_clause=None).effect == "CONFLICT"
+    assert policy.decide("REF", this_clause=bound, other_clause=None).effect == "OVERRIDE"
+
+
+def test_policy_from_file_reuses_unchanged_file(tmp_path: Path) -> None:
+    policy_path = tmp_path / "policy.json"
+    policy_path.write_text(json.dumps({"annex": [{"when": {"edge": "ANNEX_REF"}, "effect": "DEPEND"}]}), "utf-8")
+
+    first = ContextPolicy.from_file(policy_path)
+    second = ContextPolicy.from_file(policy_path)
+    assert second is not first
+    assert second.rules_for_edge("ANNEX_REF")[0] is first.rules_for_edge("ANNEX_REF")[0]
+
+    policy_path.write_text(json.dumps({"thresholds": {"mitigate_conf_min": 0.5}}), "utf-8")
+    reloaded = ContextPolicy.from_file(policy_path)
+    assert reloaded is not first
+    assert reloaded.thresholds["mitigate_conf_min"] == 0.5
+
+
+def test_from_files_returns_independent_policy_and_ruleset(samples_dir: Path) -> None:
+    paths = dict(
+        clauses_path=samples_dir / "norm_clauses.json",
+        scores_path=samples_dir / "scores.json",
+        hits_path=samples_dir / "hits.json",
+        policy_path=samples_dir / "policy.json",
+        ruleset_path=samples_dir / "ruleset_runtime.json",
+    )
+    expected = ContextResolver.from_files(**paths).resolve()
+
+    first = ContextResolver.from_files(**paths)
+    first.policy.thresholds["mitigate_conf_min"] = 0.0
+    first.policy.priorities.reverse()
+    first.policy.default_effects["REF_ARTICLE"] = "CONFLICT"
+    with pytest.raises(TypeError):
+        first.ruleset["version"] = "MUTATED"
+    with pytest.raises(TypeError):
+        first.ruleset["metadata"]["source"] = "MUTATED"
+
+    second = ContextResolver.from_files(**paths)
+    assert second.policy is not first.policy
+    assert second.ruleset["version"] == "demo"
+    assert second.ruleset["metadata"]["source"] == "fixture"
+    assert second.resolve() == expected
+
+
+def test_load_clauses_reuses_records_of_unchanged_file(tmp_path: Path) -> None:
+    clauses_path = tmp_path / "clauses.json"
+    clauses_path.write_text(json.dumps([{"id": "c1", "text": "first"}]), "utf-8")
+
+    first = load_clauses(clauses_path)
+    second = load_clauses(clauses_path)
+    assert second is not first
+    assert second["c1"] is first["c1"]
+
+    clauses_path.write_text(json.dumps([{"id": "c1", "text": "changed"}]), "utf-8")
+    assert load_clauses(clauses_path)["c1"].text == "changed"
+
+
+def test_load_clauses_hands_out_immutable_records(samples_dir: Path) -> None:
+    clauses_path = samples_dir / "norm_clauses.json"
+    loaded = load_clauses(clauses_path)
+    clause_id, clause = next(iter(loaded.items()))
+    tags = clause.tags
+
+    with pytest.raises(AttributeError):
+        clause.tags.append("MUTATED")
+    with pytest.raises(TypeError):
+        clause.def_bindings["MUTATED"] = "MUTATED"
+    with pytest.raises(FrozenInstanceError):
+        clause.tags = ("MUTATED",)
+    del loaded[clause_id]
+
+    reloaded = load_clauses(clauses_path)
+    assert reloaded[clause_id].tags == tags
+    assert "MUTATED" not in reloaded[clause_id].tags
+    assert "MUTATED" not in reloaded[clause_id].def_bindings
+
+
 def test_cli_writes_payload(tmp_path: Path, samples_dir: Path) -> None:
     out_path = tmp_path / "context.json"
     args = [
@@ -3,7 +3,7 @@ from __future__ import annotations
 import argparse
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from .policy import EvaluationPolicy, load_policy
 from .reporter import EvaluationInputs, build_report, EvaluationError
@@ -35,6 +35,25 @@ def _resolve_policy(path_str: Optional[str]) -> EvaluationPolicy:
     return load_policy(path)
 
 
+def _write_json(path: Path, payload: object) -> None:
+    # Encode straight to UTF-8 bytes; write_text would push the string through
+    # a text wrapper and a second encoding pass.
+    path.write_bytes(json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8"))
+
+
+def _inputs_key(*paths: Optional[Path]) -> Tuple[Optional[Tuple[str, int, int]], ...]:
+    # Path, mtime and size of each input file; a rewrite of any file changes
+    # the key, so a cached report is never served for stale inputs.
+    key = []
+    for path in paths:
+        if path is None:
+            key.append(None)
+            continue
+        stat = path.stat()
+        key.append((str(path.resolve()), stat.st_mtime_ns, stat.st_size))
+    return tuple(key)
+
+
 def main(argv: Optional[list[str]] = None) -> int:
     args = parse_args(argv)
 
@@ -68,7 +87,11 @@ def main(argv: Optional[list[str]] = None) -> int:
     )
 
     try:
-        bundle = build_report(inputs, policy)
+        bundle = build_report(
+            inputs,
+            policy,
+            cache_key=_inputs_key(scores_path, hits_path, golden_path, rules_path, run_stats_path),
+        )
     except EvaluationError as exc:
         raise SystemExit(f"evaluation failed: {exc}")
 
@@ -76,11 +99,10 @@ def main(argv: Optional[list[str]] = None) -> int:
     out_md_path.parent.mkdir(parents=True, exist_ok=True)
     gate_path.parent.mkdir(parents=True, exist_ok=True)
 
-    out_json_path.write_text(json.dumps(bundle.report_json, indent=2, ensure_ascii=False), encoding="utf-8")
-    out_md_path.write_text(bundle.report_markdown, encoding="utf-8")
+    _write_json(out_json_path, bundle.report_json)
+    out_md_path.write_bytes(bundle.report_markdown.encode("utf-8"))
 
-    gate_payload = bundle.gate_decision
-    gate_path.write_text(json.dumps(gate_payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    _write_json(gate_path, bundle.gate_decision)
 
     return 0
 
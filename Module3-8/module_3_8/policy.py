@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .schemas import load_json
 
 
 @dataclass(frozen=True)
@@ -35,47 +36,49 @@ class EvaluationPolicy:
 
     @staticmethod
     def default() -> "EvaluationPolicy":
-        return EvaluationPolicy(
-            matching=MatchingPolicy(),
-            gates=GatePolicy(),
-            report=ReportPolicy(),
-        )
+        # Every section is frozen, so one shared instance serves all callers.
+        return _DEFAULT_POLICY
+
+
+_DEFAULT_POLICY = EvaluationPolicy(
+    matching=MatchingPolicy(),
+    gates=GatePolicy(),
+    report=ReportPolicy(),
+)
+
+
+# (name, coercion, default) per field, taken from the dataclass defaults once
+# so that every section is decoded by the same table-driven loop.
+_FieldSpec = Tuple[Tuple[str, Callable[[Any], Any], Any], ...]
+
+
+def _field_specs(cls: type) -> _FieldSpec:
+    return tuple((field.name, type(field.default), field.default) for field in fields(cls))
+
+
+_MATCHING_FIELDS = _field_specs(MatchingPolicy)
+_GATE_FIELDS = _field_specs(GatePolicy)
+_REPORT_FIELDS = _field_specs(ReportPolicy)
+
+
+def _build_section(cls: type, specs: _FieldSpec, raw: Optional[Dict[str, Any]]) -> Any:
+    if not raw:
+        return cls()
+    get = raw.get
+    return cls(**{name: coerce(get(name, default)) for name, coerce, default in specs})
 
 
 def load_policy(path: Optional[Path]) -> EvaluationPolicy:
     if path is None:
         return EvaluationPolicy.default()
 
-    with path.open("r", encoding="utf-8") as handle:
-        raw = json.load(handle)
+    raw = load_json(path)
 
     if not isinstance(raw, dict):
         raise ValueError("policy payload must be a JSON object")
 
-    matching_raw = raw.get("matching", {}) or {}
-    gates_raw = raw.get("gates", {}) or {}
-    report_raw = raw.get("report", {}) or {}
-
-    matching = MatchingPolicy(
-        strict_match=bool(matching_raw.get("strict_match", True)),
-        allow_conservative=bool(matching_raw.get("allow_conservative", False)),
-        treat_empty_expected_rules_as_negative=bool(
-            matching_raw.get("treat_empty_expected_rules_as_negative", False)
-        ),
-    )
-
-    gates = GatePolicy(
-        min_golden_pass_rate=float(gates_raw.get("min_golden_pass_rate", 0.80)),
-        min_rule_precision=float(gates_raw.get("min_rule_precision", 0.60)),
-        min_rule_recall=float(gates_raw.get("min_rule_recall", 0.60)),
-        enforce_rule_floor_for_critical=bool(
-            gates_raw.get("enforce_rule_floor_for_critical", True)
-        ),
-    )
-
-    report = ReportPolicy(
-        top_n_problem_rules=int(report_raw.get("top_n_problem_rules", 10)),
-        show_examples_per_rule=int(report_raw.get("show_examples_per_rule", 5)),
-    )
+    matching = _build_section(MatchingPolicy, _MATCHING_FIELDS, raw.get("matching"))
+    gates = _build_section(GatePolicy, _GATE_FIELDS, raw.get("gates"))
+    report = _build_section(ReportPolicy, _REPORT_FIELDS, raw.get("report"))
 
     return EvaluationPolicy(matching=matching, gates=gates, report=report)
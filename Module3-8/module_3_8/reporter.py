@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+import copy
+import heapq
+from collections import Counter, defaultdict
 from dataclasses import dataclass
-from statistics import mean
-from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from operator import attrgetter, itemgetter
+from statistics import fmean
+from typing import Collection, Dict, FrozenSet, Hashable, List, Optional, Sequence, Set, Tuple
 
 from .policy import EvaluationPolicy
 from .schemas import (
@@ -17,8 +21,12 @@ from .schemas import (
 RISK_SEVERITY = {"OK": 0, "WARN": 1, "HIGH": 2}
 AMBIG_FLAGS = {"AMBIG", "NULL"}
 
+# Bundles built under an explicit cache key, oldest first.
+_REPORT_CACHE: Dict[Tuple[Hashable, EvaluationPolicy], "ReportBundle"] = {}
+_REPORT_CACHE_SIZE = 16
 
-@dataclass
+
+@dataclass(slots=True)
 class EvaluationInputs:
     scores: Sequence[ScoreRecord]
     hits: Sequence[HitRecord]
@@ -27,7 +35,7 @@ class EvaluationInputs:
     run_stats: Optional[RunStats] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleMetrics:
     rule_id: str
     tp: int
@@ -43,8 +51,26 @@ class RuleMetrics:
     fp_examples: List[str]
     fn_examples: List[str]
 
+    def to_dict(self) -> Dict[str, object]:
+        # Shallow on purpose: the example lists are serialized straight away.
+        return {
+            "rule_id": self.rule_id,
+            "tp": self.tp,
+            "fp": self.fp,
+            "fn": self.fn,
+            "precision": self.precision,
+            "recall": self.recall,
+            "f1": self.f1,
+            "critical": self.critical,
+            "category": self.category,
+            "subcategory": self.subcategory,
+            "variant": self.variant,
+            "fp_examples": self.fp_examples,
+            "fn_examples": self.fn_examples,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class ReportBundle:
     report_json: Dict[str, object]
     report_markdown: str
@@ -55,17 +81,36 @@ class EvaluationError(Exception):
     """Raised when inputs are invalid for evaluation."""
 
 
-def build_report(inputs: EvaluationInputs, policy: EvaluationPolicy) -> ReportBundle:
-    _validate_inputs(inputs)
-
-    scores_by_clause = {score.clause_id: score for score in inputs.scores}
-    golden_by_clause = {case.clause_id: case for case in inputs.golden}
-
-    alignment = _evaluate_alignment(golden_by_clause, scores_by_clause, policy)
+def build_report(
+    inputs: EvaluationInputs,
+    policy: EvaluationPolicy,
+    cache_key: Optional[Hashable] = None,
+) -> ReportBundle:
+    """Evaluate ``inputs`` under ``policy``.
+
+    Passing ``cache_key`` opts in to reuse: a report built earlier with the
+    same key and policy is returned without evaluating ``inputs`` again, so the
+    key must change whenever the inputs do. The CLI keys on each input file's
+    path, mtime and size. Every call returns its own copy of the bundle.
+    """
+    if cache_key is None:
+        return _build_report(inputs, policy)
+    key = (cache_key, policy)
+    bundle = _REPORT_CACHE.get(key)
+    if bundle is None:
+        bundle = _REPORT_CACHE[key] = _build_report(inputs, policy)
+        if len(_REPORT_CACHE) > _REPORT_CACHE_SIZE:
+            del _REPORT_CACHE[next(iter(_REPORT_CACHE))]
+    return copy.deepcopy(bundle)
+
+
+def _build_report(inputs: EvaluationInputs, policy: EvaluationPolicy) -> ReportBundle:
+    scores_by_clause, golden_by_clause = _index_inputs(inputs)
 
     hits_by_clause = _group_hits_by_clause(inputs.hits)
-    rule_metrics = _compute_rule_metrics(
+    alignment, rule_metrics = _evaluate_golden(
         golden_by_clause,
+        scores_by_clause,
         hits_by_clause,
         policy,
         inputs.ruleset,
@@ -81,7 +126,7 @@ def build_report(inputs: EvaluationInputs, policy: EvaluationPolicy) -> ReportBu
         "risk_distribution": risk_distribution,
         "rule_metrics": {
             "summary": _summarize_rule_metrics(rule_metrics),
-            "per_rule": [metric.__dict__ for metric in rule_metrics],
+            "per_rule": [metric.to_dict() for metric in rule_metrics],
         },
         "category_metrics": category_metrics,
         "top_problem_rules": [metric.rule_id for metric in top_rules],
@@ -113,41 +158,60 @@ def build_report(inputs: EvaluationInputs, policy: EvaluationPolicy) -> ReportBu
     )
 
 
-def _validate_inputs(inputs: EvaluationInputs) -> None:
-    clause_ids = [score.clause_id for score in inputs.scores]
-    if len(clause_ids) != len(set(clause_ids)):
+def _index_inputs(
+    inputs: EvaluationInputs,
+) -> Tuple[Dict[str, ScoreRecord], Dict[str, GoldenClause]]:
+    """Index scores and golden labels by clause id, rejecting invalid inputs."""
+    # A shorter index than its source means a clause id occurred twice.
+    scores_by_clause = {score.clause_id: score for score in inputs.scores}
+    if len(scores_by_clause) != len(inputs.scores):
         raise EvaluationError("scores payload contains duplicate clause_id values")
 
-    golden_ids = [case.clause_id for case in inputs.golden]
-    if len(golden_ids) != len(set(golden_ids)):
+    golden_by_clause = {case.clause_id: case for case in inputs.golden}
+    if len(golden_by_clause) != len(inputs.golden):
         raise EvaluationError("golden labels payload contains duplicate clause_id values")
 
-    missing = set(golden_ids) - set(clause_ids)
+    missing = golden_by_clause.keys() - scores_by_clause.keys()
     if missing:
         raise EvaluationError(
             f"scores payload missing clause_ids present in golden labels: {sorted(missing)}"
         )
+    return scores_by_clause, golden_by_clause
 
 
-def _evaluate_alignment(
+def _evaluate_golden(
     golden: Dict[str, GoldenClause],
     scores: Dict[str, ScoreRecord],
+    hits_by_clause: Dict[str, FrozenSet[str]],
     policy: EvaluationPolicy,
-) -> Dict[str, object]:
-    total = len(golden)
+    ruleset: Dict[str, RuleDefinition],
+) -> Tuple[Dict[str, object], List[RuleMetrics]]:
+    """Golden alignment and per-rule metrics from a single pass over golden."""
     passes = 0
     failures: List[Dict[str, object]] = []
     ambiguous = 0
-    flag_counts: Dict[str, int] = {}
+    flag_counts: Counter[str] = Counter()
+    strict = policy.matching.strict_match
+    conservative = policy.matching.allow_conservative
+
+    # Per clause, the expected and hit rule sets split into TP, FN and FP by
+    # set algebra; the counters then absorb each part in one C-level update.
+    treat_empty_as_negative = policy.matching.treat_empty_expected_rules_as_negative
+    no_hits: FrozenSet[str] = frozenset()
+    tp_counts: Counter[str] = Counter()
+    fp_counts: Counter[str] = Counter()
+    fn_counts: Counter[str] = Counter()
+    fp_examples: Dict[str, List[str]] = defaultdict(list)
+    fn_examples: Dict[str, List[str]] = defaultdict(list)
 
     for clause_id, case in golden.items():
         score = scores.get(clause_id)
         actual_flag = score.risk_flag if score else None
-        flag_counts[actual_flag or "MISSING"] = flag_counts.get(actual_flag or "MISSING", 0) + 1
+        flag_counts[actual_flag or "MISSING"] += 1
         if actual_flag in AMBIG_FLAGS:
             ambiguous += 1
 
-        if _flag_matches(case.expected_flag, actual_flag, policy):
+        if _flag_matches(case.expected_flag, actual_flag, strict, conservative):
             passes += 1
         else:
             failures.append(
@@ -159,14 +223,37 @@ def _evaluate_alignment(
                 }
             )
 
+        expected_rules = case.expected_rules_set
+        actual_rules = hits_by_clause.get(clause_id, no_hits)
+
+        tp_counts.update(expected_rules & actual_rules)
+        missed = expected_rules - actual_rules
+        if missed:
+            fn_counts.update(missed)
+            for rule_id in missed:
+                examples = fn_examples[rule_id]
+                if len(examples) < 5:
+                    examples.append(clause_id)
+
+        if not expected_rules and not treat_empty_as_negative:
+            continue
+        spurious = actual_rules - expected_rules
+        if spurious:
+            fp_counts.update(spurious)
+            for rule_id in spurious:
+                examples = fp_examples[rule_id]
+                if len(examples) < 5:
+                    examples.append(clause_id)
+
+    total = len(golden)
     rate = passes / total if total else 0.0
-    return {
+    alignment = {
         "total": total,
         "passes": passes,
         "failures": len(failures),
         "pass_rate": round(rate, 4),
         "ambiguous_predictions": ambiguous,
-        "flag_counts": flag_counts,
+        "flag_counts": dict(flag_counts),
         "failure_examples": failures[: policy.report.show_examples_per_rule],
         "policy": {
             "strict_match": policy.matching.strict_match,
@@ -174,124 +261,93 @@ def _evaluate_alignment(
         },
     }
 
-
-def _flag_matches(expected: str, actual: Optional[str], policy: EvaluationPolicy) -> bool:
-    if actual is None:
-        return False
-    if actual in AMBIG_FLAGS:
-        return False
-    if policy.matching.strict_match:
-        return actual == expected
-    if actual == expected:
-        return True
-    if policy.matching.allow_conservative:
-        expected_rank = RISK_SEVERITY.get(expected, 0)
-        actual_rank = RISK_SEVERITY.get(actual, 0)
-        return actual_rank >= expected_rank
-    return False
-
-
-def _group_hits_by_clause(hits: Sequence[HitRecord]) -> Dict[str, Set[str]]:
-    grouped: Dict[str, Set[str]] = {}
-    for hit in hits:
-        grouped.setdefault(hit.clause_id, set()).add(hit.rule_id)
-    return grouped
-
-
-def _compute_rule_metrics(
-    golden: Dict[str, GoldenClause],
-    hits_by_clause: Dict[str, Set[str]],
-    policy: EvaluationPolicy,
-    ruleset: Dict[str, RuleDefinition],
-) -> List[RuleMetrics]:
-    rule_counts: Dict[str, Dict[str, object]] = {}
-
-    for clause_id, case in golden.items():
-        expected_rules = set(case.expected_rules)
-        actual_rules = hits_by_clause.get(clause_id, set())
-
-        for rule_id in expected_rules:
-            counts = rule_counts.setdefault(rule_id, {
-                "tp": 0,
-                "fp": 0,
-                "fn": 0,
-                "fp_examples": [],
-                "fn_examples": [],
-            })
-            if rule_id in actual_rules:
-                counts["tp"] += 1
-            else:
-                counts["fn"] += 1
-                if len(counts["fn_examples"]) < 5:
-                    counts["fn_examples"].append(clause_id)
-
-        for rule_id in actual_rules:
-            if rule_id in expected_rules:
-                continue
-            if not expected_rules and not policy.matching.treat_empty_expected_rules_as_negative:
-                continue
-            counts = rule_counts.setdefault(rule_id, {
-                "tp": 0,
-                "fp": 0,
-                "fn": 0,
-                "fp_examples": [],
-                "fn_examples": [],
-            })
-            counts["fp"] += 1
-            if len(counts["fp_examples"]) < 5:
-                counts["fp_examples"].append(clause_id)
-
     metrics: List[RuleMetrics] = []
-    for rule_id, counts in sorted(rule_counts.items()):
+    for rule_id in sorted(tp_counts.keys() | fp_counts.keys() | fn_counts.keys()):
         definition = ruleset.get(rule_id, RuleDefinition(rule_id, None, None, None, False))
-        tp = int(counts["tp"])
-        fp = int(counts["fp"])
-        fn = int(counts["fn"])
-        precision = tp / (tp + fp) if (tp + fp) else 0.0
-        recall = tp / (tp + fn) if (tp + fn) else 0.0
-        f1 = (2 * precision * recall / (precision + recall)) if (precision + recall) else 0.0
+        tp = tp_counts[rule_id]
+        fp = fp_counts[rule_id]
+        fn = fn_counts[rule_id]
+        precision, recall, f1 = _rounded_prf(tp, fp, fn)
         metrics.append(
             RuleMetrics(
                 rule_id=rule_id,
                 tp=tp,
                 fp=fp,
                 fn=fn,
-                precision=round(precision, 4),
-                recall=round(recall, 4),
-                f1=round(f1, 4),
+                precision=precision,
+                recall=recall,
+                f1=f1,
                 critical=definition.critical,
                 category=definition.category,
                 subcategory=definition.subcategory,
                 variant=definition.variant,
-                fp_examples=list(counts["fp_examples"]),
-                fn_examples=list(counts["fn_examples"]),
+                fp_examples=list(fp_examples.get(rule_id, ())),
+                fn_examples=list(fn_examples.get(rule_id, ())),
             )
         )
 
-    return metrics
+    return alignment, metrics
+
+
+def _flag_matches(expected: str, actual: Optional[str], strict: bool, conservative: bool) -> bool:
+    if actual is None or actual in AMBIG_FLAGS:
+        return False
+    if actual == expected:
+        return True
+    if strict or not conservative:
+        return False
+    return RISK_SEVERITY.get(actual, 0) >= RISK_SEVERITY.get(expected, 0)
+
+
+def _group_hits_by_clause(hits: Sequence[HitRecord]) -> Dict[str, FrozenSet[str]]:
+    grouped: Dict[str, Set[str]] = {}
+    for hit in hits:
+        rules = grouped.get(hit.clause_id)
+        if rules is None:
+            grouped[hit.clause_id] = {hit.rule_id}
+        else:
+            rules.add(hit.rule_id)
+    # The groups are only read from here on.
+    return {clause_id: frozenset(rules) for clause_id, rules in grouped.items()}
+
+
+def _rounded_prf(tp: int, fp: int, fn: int) -> Tuple[float, float, float]:
+    """Precision, recall and F1 rounded to four places.
+
+    F1 is taken from the unrounded ratios, and the rounded values are what the
+    gates compare against, so rounding cannot be deferred to serialization.
+    """
+    predicted = tp + fp
+    actual = tp + fn
+    precision = tp / predicted if predicted else 0.0
+    recall = tp / actual if actual else 0.0
+    combined = precision + recall
+    f1 = 2 * precision * recall / combined if combined else 0.0
+    return round(precision, 4), round(recall, 4), round(f1, 4)
 
 
 def _aggregate_categories(metrics: Sequence[RuleMetrics]) -> List[Dict[str, object]]:
-    buckets: Dict[Tuple[Optional[str], Optional[str]], Dict[str, float]] = {}
+    # Bucket values are [tp, fp, fn, rule_ids]; lists are cheaper to create
+    # and update positionally than per-bucket dicts.
+    buckets: Dict[Tuple[Optional[str], Optional[str]], List] = defaultdict(lambda: [0, 0, 0, []])
     for metric in metrics:
-        key = (metric.category, metric.subcategory)
-        bucket = buckets.setdefault(
-            key,
-            {"tp": 0, "fp": 0, "fn": 0, "rules": []},
-        )
-        bucket["tp"] += metric.tp
-        bucket["fp"] += metric.fp
-        bucket["fn"] += metric.fn
-        bucket["rules"].append(metric.rule_id)
+        bucket = buckets[(metric.category, metric.subcategory)]
+        bucket[0] += metric.tp
+        bucket[1] += metric.fp
+        bucket[2] += metric.fn
+        bucket[3].append(metric.rule_id)
+
+    # The sort key treats missing parts as "", built once per bucket; only the
+    # key is compared, so None and "" buckets keep their first-seen order.
+    keyed = [
+        ((category or "", subcategory or ""), category, subcategory, bucket)
+        for (category, subcategory), bucket in buckets.items()
+    ]
+    keyed.sort(key=itemgetter(0))
 
     category_metrics: List[Dict[str, object]] = []
-    for (category, subcategory), counts in sorted(buckets.items(), key=lambda item: (item[0][0] or "", item[0][1] or "")):
-        tp = counts["tp"]
-        fp = counts["fp"]
-        fn = counts["fn"]
-        precision = tp / (tp + fp) if (tp + fp) else 0.0
-        recall = tp / (tp + fn) if (tp + fn) else 0.0
-        f1 = (2 * precision * recall / (precision + recall)) if (precision + recall) else 0.0
+    for _, category, subcategory, (tp, fp, fn, rules) in keyed:
+        precision, recall, f1 = _rounded_prf(tp, fp, fn)
         category_metrics.append(
             {
                 "category": category,
@@ -299,24 +355,22 @@ def _aggregate_categories(metrics: Sequence[RuleMetrics]) -> List[Dict[str, obje
                 "tp": int(tp),
                 "fp": int(fp),
                 "fn": int(fn),
-                "precision": round(precision, 4),
-                "recall": round(recall, 4),
-                "f1": round(f1, 4),
-                "rules": sorted(counts["rules"]),
+                "precision": precision,
+                "recall": recall,
+                "f1": f1,
+                "rules": sorted(rules),
             }
         )
     return category_metrics
 
 
-def _summarize_risk(scores: Iterable[ScoreRecord]) -> Dict[str, object]:
-    flag_counts: Dict[str, int] = {}
-    confidences: List[float] = []
-    for score in scores:
-        flag_counts[score.risk_flag] = flag_counts.get(score.risk_flag, 0) + 1
-        confidences.append(score.confidence)
+def _summarize_risk(scores: Collection[ScoreRecord]) -> Dict[str, object]:
+    # Both columns are gathered by C-level maps rather than a Python loop. The
+    # report always carries every statistic, so the sort is not skippable.
+    flag_counts = Counter(map(attrgetter("risk_flag"), scores))
+    confidences_sorted = sorted(map(attrgetter("confidence"), scores))
 
-    if confidences:
-        confidences_sorted = sorted(confidences)
+    if confidences_sorted:
         mid = len(confidences_sorted) // 2
         if len(confidences_sorted) % 2:
             median = confidences_sorted[mid]
@@ -325,7 +379,9 @@ def _summarize_risk(scores: Iterable[ScoreRecord]) -> Dict[str, object]:
         p90_index = max(int(len(confidences_sorted) * 0.9) - 1, 0)
         p90 = confidences_sorted[p90_index]
         stats = {
-            "average": round(mean(confidences_sorted), 4),
+            # fmean sums in floating point rather than through the exact
+            # fractions statistics.mean uses.
+            "average": round(fmean(confidences_sorted), 4),
             "median": round(median, 4),
             "p90": round(p90, 4),
             "min": round(confidences_sorted[0], 4),
@@ -335,7 +391,7 @@ def _summarize_risk(scores: Iterable[ScoreRecord]) -> Dict[str, object]:
         stats = {"average": 0.0, "median": 0.0, "p90": 0.0, "min": 0.0, "max": 0.0}
 
     return {
-        "flag_counts": flag_counts,
+        "flag_counts": dict(flag_counts),
         "confidence_stats": stats,
     }
 
@@ -344,31 +400,31 @@ def _select_top_problem_rules(
     metrics: Sequence[RuleMetrics],
     limit: int,
 ) -> List[RuleMetrics]:
-    def score(metric: RuleMetrics) -> Tuple[float, float, str]:
-        return (
-            -(metric.fn + metric.fp),
-            metric.f1,
-            metric.rule_id,
-        )
-
-    sorted_metrics = sorted(metrics, key=score)
+    # Only the first ``limit`` entries are kept, so a bounded heap selection
+    # replaces the full sort; other limits keep the slice semantics.
+    if 0 <= limit < len(metrics):
+        return heapq.nsmallest(limit, metrics, key=_problem_key)
+    sorted_metrics = sorted(metrics, key=_problem_key)
     return sorted_metrics[:limit]
 
 
+def _problem_key(metric: RuleMetrics) -> Tuple[int, float, str]:
+    # Most errors first, then lowest F1, then rule id.
+    return (-(metric.fn + metric.fp), metric.f1, metric.rule_id)
+
+
 def _summarize_rule_metrics(metrics: Sequence[RuleMetrics]) -> Dict[str, object]:
-    tp = sum(metric.tp for metric in metrics)
-    fp = sum(metric.fp for metric in metrics)
-    fn = sum(metric.fn for metric in metrics)
-    precision = tp / (tp + fp) if (tp + fp) else 0.0
-    recall = tp / (tp + fn) if (tp + fn) else 0.0
-    f1 = (2 * precision * recall / (precision + recall)) if (precision + recall) else 0.0
+    tp = sum(map(attrgetter("tp"), metrics))
+    fp = sum(map(attrgetter("fp"), metrics))
+    fn = sum(map(attrgetter("fn"), metrics))
+    precision, recall, f1 = _rounded_prf(tp, fp, fn)
     return {
         "tp": tp,
         "fp": fp,
         "fn": fn,
-        "precision": round(precision, 4),
-        "recall": round(recall, 4),
-        "f1": round(f1, 4),
+        "precision": precision,
+        "recall": recall,
+        "f1": f1,
     }
 
 
@@ -388,21 +444,23 @@ def _make_gate_decision(
             f"golden pass rate {pass_rate:.2f} below minimum {policy.gates.min_golden_pass_rate:.2f}"
         )
 
+    # Rules that clear both floors are the common case; read the thresholds
+    # once and format nothing until a rule actually fails.
+    min_precision = policy.gates.min_rule_precision
+    min_recall = policy.gates.min_rule_recall
+    enforce_critical = policy.gates.enforce_rule_floor_for_critical
     for metric in metrics:
-        precision_ok = metric.precision >= policy.gates.min_rule_precision
-        recall_ok = metric.recall >= policy.gates.min_rule_recall
+        precision_ok = metric.precision >= min_precision
+        recall_ok = metric.recall >= min_recall
         if precision_ok and recall_ok:
             continue
         reason_parts = []
         if not precision_ok:
-            reason_parts.append(
-                f"precision {metric.precision:.2f} < {policy.gates.min_rule_precision:.2f}"
-            )
+            reason_parts.append(f"precision {metric.precision:.2f} < {min_precision:.2f}")
         if not recall_ok:
-            reason_parts.append(
-                f"recall {metric.recall:.2f} < {policy.gates.min_rule_recall:.2f}"
-            )
-        is_critical = metric.critical and policy.gates.enforce_rule_floor_for_critical
+            reason_parts.append(f"recall {metric.recall:.2f} < {min_recall:.2f}")
+        reason = "; ".join(reason_parts)
+        is_critical = metric.critical and enforce_critical
         if is_critical or reason_parts:
             failing_rules.append(
                 {
@@ -410,14 +468,12 @@ def _make_gate_decision(
                     "precision": metric.precision,
                     "recall": metric.recall,
                     "critical": metric.critical,
-                    "reason": "; ".join(reason_parts) or "below configured floor",
+                    "reason": reason or "below configured floor",
                 }
             )
             if is_critical:
                 allowed = False
-                notes.append(
-                    f"critical rule {metric.rule_id} failed threshold: {'; '.join(reason_parts)}"
-                )
+                notes.append(f"critical rule {metric.rule_id} failed threshold: {reason}")
 
     decision = {
         "allowed": allowed,
@@ -443,69 +499,48 @@ def _render_markdown_summary(
     gate_decision: Dict[str, object],
     policy: EvaluationPolicy,
 ) -> str:
-    lines: List[str] = []
-    lines.append("# Evaluation Summary")
-    lines.append("")
-    lines.append(
-        f"- Golden match rate: {alignment.get('passes', 0)}/{alignment.get('total', 0)}"
-        f" ({alignment.get('pass_rate', 0.0):.2%})"
-    )
-    lines.append(
-        f"- Gate decision: {'allowed' if gate_decision.get('allowed') else 'blocked'}"
-    )
-    lines.append(
-        "- Policy: strict_match="
-        f"{policy.matching.strict_match}, allow_conservative={policy.matching.allow_conservative}"
-    )
-    lines.append("")
-
-    lines.append("## Top Problem Rules")
-    if not top_rules:
-        lines.append("- All evaluated rules met the configured thresholds.")
-    else:
-        for metric in top_rules:
-            lines.append(
-                "- "
-                f"{metric.rule_id}: precision {metric.precision:.2f}, recall {metric.recall:.2f}, "
-                f"FN {metric.fn}, FP {metric.fp}"
-            )
-    lines.append("")
-
-    lines.append("## Category View")
-    if not category_metrics:
-        lines.append("- No category metadata supplied.")
-    else:
-        for entry in category_metrics:
-            category = entry.get("category") or "UNCATEGORIZED"
-            subcategory = entry.get("subcategory") or "-"
-            lines.append(
-                f"- {category}/{subcategory}: precision {entry['precision']:.2f}, "
-                f"recall {entry['recall']:.2f} (rules {', '.join(entry['rules'])})"
-            )
-    lines.append("")
-
-    lines.append("## Risk Distribution")
+    top_lines = [
+        f"- {metric.rule_id}: precision {metric.precision:.2f}, recall {metric.recall:.2f}, "
+        f"FN {metric.fn}, FP {metric.fp}"
+        for metric in top_rules
+    ] or ["- All evaluated rules met the configured thresholds."]
+    category_lines = [
+        f"- {entry.get('category') or 'UNCATEGORIZED'}/{entry.get('subcategory') or '-'}: "
+        f"precision {entry['precision']:.2f}, recall {entry['recall']:.2f} "
+        f"(rules {', '.join(entry['rules'])})"
+        for entry in category_metrics
+    ] or ["- No category metadata supplied."]
     flag_counts = risk_distribution.get("flag_counts", {})
     if flag_counts:
-        lines.append("- Flags: " + ", ".join(f"{flag}={count}" for flag, count in flag_counts.items()))
+        flags_line = "- Flags: " + ", ".join(f"{flag}={count}" for flag, count in flag_counts.items())
     else:
-        lines.append("- Flags: none")
+        flags_line = "- Flags: none"
     confidence = risk_distribution.get("confidence_stats", {})
-    lines.append(
-        "- Confidence: mean {average:.2f}, median {median:.2f}, p90 {p90:.2f}".format(**{
-            "average": confidence.get("average", 0.0),
-            "median": confidence.get("median", 0.0),
-            "p90": confidence.get("p90", 0.0),
-        })
-    )
-    lines.append("")
-
-    lines.append("## Gate Rationale")
     notes = gate_decision.get("notes", [])
-    if notes:
-        for note in notes:
-            lines.append(f"- {note}")
-    else:
-        lines.append("- All thresholds satisfied.")
+    note_lines = [f"- {note}" for note in notes] or ["- All thresholds satisfied."]
 
+    # Sections are assembled as whole line lists and joined once.
+    lines: List[str] = [
+        "# Evaluation Summary",
+        "",
+        f"- Golden match rate: {alignment.get('passes', 0)}/{alignment.get('total', 0)}"
+        f" ({alignment.get('pass_rate', 0.0):.2%})",
+        f"- Gate decision: {'allowed' if gate_decision.get('allowed') else 'blocked'}",
+        "- Policy: strict_match="
+        f"{policy.matching.strict_match}, allow_conservative={policy.matching.allow_conservative}",
+        "",
+        "## Top Problem Rules",
+        *top_lines,
+        "",
+        "## Category View",
+        *category_lines,
+        "",
+        "## Risk Distribution",
+        flags_line,
+        f"- Confidence: mean {confidence.get('average', 0.0):.2f}, "
+        f"median {confidence.get('median', 0.0):.2f}, p90 {confidence.get('p90', 0.0):.2f}",
+        "",
+        "## Gate Rationale",
+        *note_lines,
+    ]
     return "\n".join(lines)
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
 import json
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Tuple
 
 
-_UTF8_SIG = "utf-8-sig"
+def _intern_ids(values: Iterable[Any]) -> Tuple[str, ...]:
+    return tuple(sys.intern(str(value)) for value in values)
 
 
-@dataclass
+@dataclass(slots=True)
 class ScoreRecord:
     clause_id: str
     confidence: float
@@ -19,16 +21,18 @@ class ScoreRecord:
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "ScoreRecord":
+        # Clause and rule ids key every lookup in the reporter; interning lets
+        # repeated ids share one object so dict probes match on identity.
         return cls(
-            clause_id=str(payload["clause_id"]),
+            clause_id=sys.intern(str(payload["clause_id"])),
             confidence=float(payload.get("confidence", 0.0)),
             risk_flag=str(payload.get("risk_flag", "AMBIG")),
-            adopted_rules=tuple(str(rule) for rule in payload.get("adopted_rules", []) or []),
+            adopted_rules=_intern_ids(payload.get("adopted_rules", []) or []),
             reasons=tuple(str(reason) for reason in payload.get("reasons", []) or []),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class HitRecord:
     rule_id: str
     clause_id: str
@@ -38,27 +42,33 @@ class HitRecord:
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "HitRecord":
         return cls(
-            rule_id=str(payload.get("rule_id", "")),
-            clause_id=str(payload.get("clause_id", "")),
+            rule_id=sys.intern(str(payload.get("rule_id", ""))),
+            clause_id=sys.intern(str(payload.get("clause_id", ""))),
             match_type=str(payload.get("match_type", "")),
             strength=float(payload.get("strength", 0.0)),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class GoldenClause:
     clause_id: str
     expected_flag: str
     expected_rules: Tuple[str, ...] = field(default_factory=tuple)
     notes: Optional[str] = None
+    expected_rules_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Rule metrics compare against the expected rules as a set; build it
+        # once per clause instead of once per report.
+        self.expected_rules_set = frozenset(self.expected_rules)
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "GoldenClause":
         expected_rules_payload = payload.get("expected_rules", []) or []
         return cls(
-            clause_id=str(payload["clause_id"]),
+            clause_id=sys.intern(str(payload["clause_id"])),
             expected_flag=str(payload.get("expected_flag", "AMBIG")),
-            expected_rules=tuple(str(rule) for rule in expected_rules_payload),
+            expected_rules=_intern_ids(expected_rules_payload),
             notes=str(payload["notes"]) if payload.get("notes") is not None else None,
         )
 
@@ -80,7 +90,7 @@ def _resolve_critical_flag(flags_payload: Any) -> bool:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleDefinition:
     rule_id: str
     category: Optional[str]
@@ -90,7 +100,7 @@ class RuleDefinition:
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "RuleDefinition":
-        rule_id = str(payload.get("id") or payload.get("rule_id") or "")
+        rule_id = sys.intern(str(payload.get("id") or payload.get("rule_id") or ""))
         metadata = payload.get("metadata", {}) or {}
         flags_payload = payload.get("flags")
         critical = _resolve_critical_flag(flags_payload)
@@ -103,7 +113,7 @@ class RuleDefinition:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class RunStats:
     timings: Dict[str, float] = field(default_factory=dict)
     memory_mb: Optional[float] = None
@@ -122,8 +132,9 @@ class RunStats:
 
 
 def load_json(path: Path) -> Any:
-    with path.open("r", encoding=_UTF8_SIG) as handle:
-        return json.load(handle)
+    # json.loads detects the encoding of raw bytes (including a UTF-8 BOM), so
+    # the file is read in one call without a text-mode decoding layer.
+    return json.loads(path.read_bytes())
 
 
 def load_scores(path: Path) -> List[ScoreRecord]:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from pathlib import Path
 import sys
 
@@ -54,6 +55,26 @@ def test_build_report_produces_expected_metrics(sample_dir: Path) -> None:
     assert "Gate decision" in markdown
 
 
+def test_build_report_reuses_report_for_cache_key(sample_dir: Path) -> None:
+    policy = load_policy(sample_dir / "policy.json")
+    inputs = EvaluationInputs(
+        scores=load_scores(sample_dir / "scores.json"),
+        hits=load_hits(sample_dir / "hits.json"),
+        golden=load_golden(sample_dir / "golden_labels.json"),
+        ruleset=load_ruleset(sample_dir / "ruleset_runtime.json"),
+    )
+    expected = build_report(inputs, policy).report_json
+
+    first = build_report(inputs, policy, cache_key="samples")
+    first.report_json["golden_alignment"]["pass_rate"] = 0.0
+
+    # A repeat call with the same key serves the cached report without
+    # looking at the (here emptied) inputs, and gets its own copy of it.
+    second = build_report(replace(inputs, scores=[], golden=[]), policy, cache_key="samples")
+    assert second is not first
+    assert second.report_json == expected
+
+
 def test_cli_writes_outputs(tmp_path: Path, sample_dir: Path) -> None:
     from module_3_8.cli import main
 